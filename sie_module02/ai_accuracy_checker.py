@@ -79,7 +79,7 @@ class AIAccuracyChecker:
                     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
                     response = requests.get(source_value, headers=headers, timeout=20)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     for script_or_style in soup(["script", "style"]):
                         script_or_style.decompose()
                     content = soup.get_text(separator='\n', strip=True)
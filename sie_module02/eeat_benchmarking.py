@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import re
@@ -9,6 +10,7 @@ from typing import Dict, List, Optional, Tuple
 import streamlit as st
 from datetime import datetime, timedelta
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import google.generativeai as genai
@@ -17,6 +19,9 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("警告: google-generativeai 未安裝，Gemini API 功能將無法使用")
 
+# 競爭對手並行抓取的最大執行緒數
+MAX_FETCH_WORKERS = 8
+
 class EEATBenchmarkingAnalyzer:
     """動態 E-E-A-T 評估與競爭基準分析器"""
     
@@ -25,6 +30,10 @@ class EEATBenchmarkingAnalyzer:
         self.session.headers.update({
             'User-Agent': 'SIE-Benchmarking-Tool/1.0 (contact@example.com)'
         })
+        # 連線池需容納並行抓取的執行緒數，否則多出的連線會被丟棄重建
+        adapter = HTTPAdapter(pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_FETCH_WORKERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # 初始化 Gemini API
         if gemini_api_key and GEMINI_AVAILABLE:
@@ -105,7 +114,7 @@ class EEATBenchmarkingAnalyzer:
         try:
             response = self.session.get(target_website, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # 檢查 AI 技術指標
                 ai_tech_indicators = []
@@ -312,17 +321,25 @@ class EEATBenchmarkingAnalyzer:
         }
         
         try:
-            # 分析目標網站
-            target_analysis = self._analyze_single_competitor(target_website, "Target")
-            
-            # 分析競爭對手
-            competitor_analyses = []
-            for competitor in competitors:
-                try:
-                    comp_analysis = self._analyze_single_competitor(competitor, f"Competitor {competitors.index(competitor) + 1}")
-                    competitor_analyses.append(comp_analysis)
-                except Exception as e:
-                    st.warning(f"⚠️ 無法分析競爭對手 {competitor}: {str(e)}")
+            # 目標網站與各競爭對手的抓取皆為 I/O 等待，同時送出請求；
+            # 執行緒只做抓取，st.* 呼叫仍留在主執行緒
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                target_future = executor.submit(self._analyze_single_competitor, target_website, "Target")
+                competitor_futures = [
+                    (competitor, executor.submit(self._analyze_single_competitor, competitor, f"Competitor {i}"))
+                    for i, competitor in enumerate(competitors, 1)
+                ]
+                
+                # 分析目標網站
+                target_analysis = target_future.result()
+                
+                # 分析競爭對手
+                competitor_analyses = []
+                for competitor, future in competitor_futures:
+                    try:
+                        competitor_analyses.append(future.result())
+                    except Exception as e:
+                        st.warning(f"⚠️ 無法分析競爭對手 {competitor}: {str(e)}")
             
             competitor_benchmarking["competitor_analysis"] = [target_analysis] + competitor_analyses
             
@@ -378,7 +395,7 @@ class EEATBenchmarkingAnalyzer:
         try:
             response = self.session.get(website, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # 模擬分析結果
                 analysis = {
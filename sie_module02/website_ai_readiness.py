@@ -1,12 +1,26 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import hashlib
+import copy
+import http.cookiejar
 import re
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from bisect import bisect_right
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+from bs4 import BeautifulSoup, SoupStrainer
+import io
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from types import MappingProxyType
 import streamlit as st
+from streamlit import runtime as st_runtime
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 try:
     import google.generativeai as genai
@@ -15,14 +29,549 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("警告: google-generativeai 未安裝，Gemini API 功能將無法使用")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    from xml.etree import ElementTree
+    LXML_AVAILABLE = False
+    print("警告: lxml 未安裝，將改用較慢的 html.parser 解析 HTML")
+
+def _json_dumps_compact(data, sort_keys: bool = False) -> str:
+    """序列化為不含縮排與多餘空白的 JSON（保留非 ASCII 字元），用於提示詞以減少 token 數；
+    sort_keys=True 時輸出固定順序，可作為快取鍵。有 orjson 時使用 C 實作"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS if sort_keys else None).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+
+def _json_loads(text):
+    """解析 JSON；有 orjson 時使用 C 實作（其 JSONDecodeError 為 json.JSONDecodeError 的子類別）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# HTML 解析器：lxml 以 C 實作，解析速度遠快於純 Python 的 html.parser；未安裝時才退回 html.parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# 評論頁只需要 <body> 與 JSON-LD <script>；其餘 <head> 內容（style、meta、link 等）不建立節點。
+# SoupStrainer 只篩選最外層的標籤，符合的 <body> 會完整保留整棵子樹
+_REVIEW_PAGE_STRAINER = SoupStrainer(['script', 'body'])
+# 首頁另外保留 <title>，讓頁面全文的關鍵字檢查仍涵蓋標題
+_HOMEPAGE_STRAINER = SoupStrainer(['title', 'script', 'body'])
+
+def _parse_html(content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """以共用的解析器解析 HTML。
+    parse_only 只在使用 lxml 時套用：lxml 會為沒有 <body> 標籤的頁面補上隱含的 <body>，
+    html.parser 不會，篩選後整頁文字都會被丟棄"""
+    return BeautifulSoup(content, HTML_PARSER, parse_only=parse_only if LXML_AVAILABLE else None)
+
+# 讀取上限：結構檢查只需要前段內容，避免大型網站的檔案整份載入記憶體
+ROOT_FILE_MAX_BYTES = 256 * 1024
+# Google 只讀取 robots.txt 的前 500 KiB，超出部分一律忽略
+ROBOTS_TXT_MAX_BYTES = 500 * 1024
+# sitemap.xml 只驗證根元素，前 4 KiB 已足夠
+SITEMAP_PROBE_MAX_BYTES = 4 * 1024
+HOMEPAGE_MAX_BYTES = 1024 * 1024
+# 各根檔案的讀取上限，請求時同時以 Range 標頭告知伺服器只需傳送這個範圍
+ROOT_FILE_LIMITS: Mapping[str, int] = MappingProxyType({
+    'robots.txt': ROBOTS_TXT_MAX_BYTES,
+    'sitemap.xml': SITEMAP_PROBE_MAX_BYTES,
+    'llms.txt': ROOT_FILE_MAX_BYTES,
+})
+
+# 根檔案（robots.txt 等）快取時間；過期後以 ETag / Last-Modified 條件請求重新驗證
+ROOT_FILES_CACHE_TTL_SECONDS = 6 * 3600
+# 根檔案快取最多保留的主機數，超過時淘汰最久未更新者（每台主機最多約 760 KiB 內容）
+ROOT_FILES_CACHE_MAX_HOSTS = 64
+
+# 頁面（首頁與評論分頁）的短期快取：同一網站換個品類重新分析時不必重新下載
+PAGE_CACHE_TTL_SECONDS = 600
+PAGE_CACHE_MAX_ENTRIES = 32
+# 正規化快取鍵時移除的追蹤參數
+_TRACKING_PARAM_RE = re.compile(r'utm_.*|fbclid|gclid', re.I)
+
+def _normalize_url(url: str) -> str:
+    """快取鍵用的網址正規化：scheme 與主機轉小寫，移除 fragment 與追蹤參數"""
+    parts = urlsplit(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAM_RE.fullmatch(key)
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+# robots.txt 中檢查的 AI 爬蟲
+AI_BOTS = ('google-extended', 'gptbot', 'anthropic-ai', 'claude-ai')
+
+@lru_cache(maxsize=32)
+def _parse_robots(content: bytes) -> RobotFileParser:
+    """解析 robots.txt；同一份內容（例如沿用快取的根檔案）只解析一次。回傳的解析器僅供讀取"""
+    robots_parser = RobotFileParser()
+    robots_parser.parse(_decode(content).splitlines())
+    return robots_parser
+
+# sitemap.xml 合法的根元素（不含命名空間）
+SITEMAP_ROOT_TAGS = frozenset(('urlset', 'sitemapindex'))
+
+def _sitemap_root_is_valid(content: bytes) -> bool:
+    """以增量解析讀到第一個元素即停止，判斷 sitemap 的根元素是否正確；無法解析時視為格式錯誤"""
+    try:
+        if LXML_AVAILABLE:
+            _, root = next(etree.iterparse(io.BytesIO(content), events=('start',), resolve_entities=False))
+        else:
+            _, root = next(ElementTree.iterparse(io.BytesIO(content), events=('start',)))
+    except (SyntaxError, StopIteration):  # lxml 與 ElementTree 的解析錯誤皆為 SyntaxError 子類別
+        return False
+    return root.tag.rsplit('}', 1)[-1] in SITEMAP_ROOT_TAGS
+
+# 評論分頁並行抓取的最大執行緒數
+MAX_REVIEW_FETCH_WORKERS = 5
+
+# 單次分析對同一主機同時送出的最多請求數（根檔案 + 首頁，或評論分頁並行抓取）
+MAX_CONCURRENT_REQUESTS_PER_ANALYSIS = max(len(ROOT_FILE_LIMITS) + 1, MAX_REVIEW_FETCH_WORKERS)
+# 共用 session 的每主機連線池大小：保留數個使用者同時分析同一網站的餘裕，避免請求在連線池排隊
+HTTP_POOL_MAXSIZE = 4 * MAX_CONCURRENT_REQUESTS_PER_ANALYSIS
+
+# 要求 Gemini 以 JSON 回應（response_mime_type），回應文字可直接解析；
+# 以一般 dict 傳入，相容 google-generativeai 各版本對 generation_config 的型別檢查
+JSON_GENERATION_CONFIG: Dict[str, str] = {"response_mime_type": "application/json"}
+
+# LLM 結果的磁碟快取（與 ai_accuracy_checker 共用 cache 目錄）
+CACHE_DIR = "cache"
+FAQ_CACHE_EXPIRATION_SECONDS = 86400  # 24 小時
+RECOMMENDATION_CACHE_EXPIRATION_SECONDS = 3600  # 1 小時
+
+def _get_cache_path(key: str) -> str:
+    """根據快取鍵生成快取檔案路徑"""
+    hashed_key = hashlib.md5(key.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{hashed_key}.json")
+
+def _load_cached_json(key: str, max_age: int):
+    """讀取未過期的快取，不存在或已過期時回傳 None"""
+    cache_path = _get_cache_path(key)
+    try:
+        if (time.time() - os.path.getmtime(cache_path)) < max_age:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _save_cached_json(key: str, data) -> None:
+    """寫入快取；寫入失敗不影響分析流程"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_get_cache_path(key), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+def _valid_faqs(data) -> List[Dict[str, str]]:
+    """只保留 zh/en 皆為字串的 FAQ 項目。JSON 模式沒有指定 schema，模型有時會把清單包在物件中
+    （例如 {"faqs": [...]}），此時取物件中的第一個清單；找不到清單時回傳空清單"""
+    if isinstance(data, dict):
+        data = next((value for value in data.values() if isinstance(value, list)), None)
+    if not isinstance(data, list):
+        return []
+    return [
+        {"zh": item["zh"], "en": item["en"]} for item in data
+        if isinstance(item, dict) and isinstance(item.get("zh"), str) and isinstance(item.get("en"), str)
+    ]
+
+def _valid_recommendations(data) -> List[Dict]:
+    """取出 {"recommendations": [...]} 中的建議項目（只保留 dict）；格式不符時回傳空清單"""
+    items = data.get("recommendations") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+def _decode(content: bytes) -> str:
+    """將截斷後的內容解碼為文字（截斷處的不完整字元以替代字元處理）"""
+    return content.decode('utf-8', errors='replace')
+
+# 語義化 HTML 標籤
+SEMANTIC_TAGS = ('article', 'section', 'nav', 'header', 'footer', 'main', 'aside')
+
+# 各產品品類的相關關鍵字（產品權威性檢查用），未列出的品類使用通用關鍵字
+_AUTHORITY_CATEGORY_KEYWORDS = {
+    "除濕機": frozenset(["dehumidifier", "除濕", "乾燥", "濕度"]),
+    "冷氣": frozenset(["air conditioner", "冷氣", "空調", "製冷"]),
+    "洗衣機": frozenset(["washing machine", "洗衣", "洗滌"]),
+    "冰箱": frozenset(["refrigerator", "冰箱", "冷藏", "冷凍"]),
+    "電視": frozenset(["tv", "television", "電視", "顯示器"]),
+    "手機": frozenset(["mobile", "phone", "smartphone", "手機", "智慧型手機"]),
+    "筆電": frozenset(["laptop", "notebook", "筆電", "筆記型電腦"]),
+    "平板": frozenset(["tablet", "ipad", "平板", "平板電腦"]),
+    "相機": frozenset(["camera", "相機", "攝影", "拍照"]),
+    "音響": frozenset(["speaker", "audio", "音響", "喇叭"]),
+}
+_AUTHORITY_FALLBACK_KEYWORDS = frozenset(["產品", "product", "規格", "specification", "功能", "feature"])
+
+
+# 各產品品類的 FAQ 相關關鍵字，未列出的品類使用通用關鍵字
+_FAQ_CATEGORY_KEYWORDS = {
+    "除濕機": frozenset(["除濕", "濕度", "乾燥", "冷凝"]),
+    "冷氣": frozenset(["冷氣", "空調", "製冷", "溫度"]),
+    "洗衣機": frozenset(["洗衣", "洗滌", "清潔"]),
+    "冰箱": frozenset(["冰箱", "冷藏", "冷凍", "保鮮"]),
+    "電視": frozenset(["電視", "顯示器", "螢幕"]),
+    "手機": frozenset(["手機", "智慧型手機", "通話", "app"]),
+    "筆電": frozenset(["筆電", "筆記型電腦", "電腦", "處理器"]),
+    "平板": frozenset(["平板", "平板電腦", "觸控"]),
+    "相機": frozenset(["相機", "攝影", "拍照", "鏡頭"]),
+    "音響": frozenset(["音響", "喇叭", "音樂", "音質"]),
+}
+_FAQ_FALLBACK_KEYWORDS = frozenset(["產品", "使用", "功能", "問題"])
+
+def _keyword_alternation(keywords) -> re.Pattern:
+    """將關鍵字合併為單一不分大小寫的模式；較長的關鍵字排前面，並固定順序讓模式內容穩定"""
+    return re.compile("|".join(map(re.escape, sorted(keywords, key=lambda k: (-len(k), k)))), re.I)
+
+# 品類名稱加上該品類相關關鍵字的模式；同一品類只編譯一次
+@lru_cache(maxsize=128)
+def _authority_keyword_re(product_category: str) -> re.Pattern:
+    return _keyword_alternation({product_category.lower()} | _AUTHORITY_CATEGORY_KEYWORDS.get(product_category, _AUTHORITY_FALLBACK_KEYWORDS))
+
+@lru_cache(maxsize=128)
+def _faq_keyword_re(product_category: str) -> re.Pattern:
+    return _keyword_alternation({product_category.lower()} | _FAQ_CATEGORY_KEYWORDS.get(product_category, _FAQ_FALLBACK_KEYWORDS))
+
+# FAQ 標題關鍵字
+_FAQ_HEADING_RE = _keyword_alternation(["faq", "常見問題", "frequently asked", "q&a", "問答"])
+
+# 預先編譯的正規表示式，避免每次檢查時重新編譯
+_FAQ_CLASS_RE = re.compile(r'faq|question|answer', re.I)
+_AUTHORITY_RE = re.compile(r"(\d+|專家|醫師|官方|engineer|official|data|statistic|report|study)")
+# 產品資訊完整性信號：以具名群組將多組關鍵字合併為單一模式，一次掃描即可得知命中哪些類別
+_PRODUCT_SIGNAL_RE = re.compile(
+    r"(?P<tech_specs>規格|specification|技術|technical|參數|parameter)"
+    r"|(?P<comparison>比較|compare|對比|vs|versus)"
+    r"|(?P<expert>專家|expert|專業|professional|評測|review)"
+)
+# 常見問題類型
+_COMMON_QUESTION_RE = re.compile(
+    "|".join(map(re.escape, [
+        "如何", "怎麼", "為什麼", "什麼時候", "哪裡", "多少錢",
+        "how", "why", "when", "where", "what", "price", "cost"
+    ]))
+)
+
+def _scan_signals(pattern: re.Pattern, text: str) -> set:
+    """單次掃描文字，回傳命中的具名群組；所有群組都命中後即停止"""
+    found = set()
+    wanted = len(pattern.groupindex)
+    for match in pattern.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) == wanted:
+            break
+    return found
+
+# 評論區塊常見的 class/id（多語系）
+REVIEW_CLASSES = [
+    'review', 'reviews', 'user-review', 'user-reviews', 'comment', 'comments', 'rating', 'ratings',
+    '評價', '用戶評論', '用戶評價', '買家評論', '買家評價', '商品評論', '商品評價', '星級', '星星', '星', '評論'
+]
+_REVIEW_CLASS_RE = re.compile("|".join(map(re.escape, REVIEW_CLASSES)), re.I)
+
+# 評論關鍵字（多語系）
+REVIEW_KEYWORDS = [
+    'review', 'reviews', 'user review', 'user reviews', 'comment', 'comments', 'rating', 'ratings',
+    '評價', '用戶評論', '用戶評價', '買家評論', '買家評價', '商品評論', '商品評價', '星級', '星星', '星', '評論'
+]
+_REVIEW_KEYWORD_RE = re.compile("|".join(map(re.escape, REVIEW_KEYWORDS)), re.I)
+# 分頁連結／按鈕文字（下一頁、更多評論等）
+NEXT_PAGE_TEXTS = ['next', '下一頁', '下頁', 'more reviews', '更多評論', '查看更多', '>>', '›']
+_NEXT_PAGE_TEXT_RE = re.compile("|".join(map(re.escape, NEXT_PAGE_TEXTS)), re.I)
+# 簡易情感詞典
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'love', 'best', '讚', '好', '棒', '推薦', '滿意', '值得', '喜歡', '優秀', 'positive']
+NEGATIVE_WORDS = ['bad', 'poor', 'terrible', 'hate', 'worst', '爛', '差', '失望', '負評', '不推', '糟', 'negative']
+# 英文詞以單字集合比對（一次切詞、兩次集合交集）；中文沒有空白分詞，仍以單一模式掃描
+_ASCII_WORD_RE = re.compile(r"[a-z]+")
+_POSITIVE_TOKENS = frozenset(w for w in POSITIVE_WORDS if w.isascii())
+_NEGATIVE_TOKENS = frozenset(w for w in NEGATIVE_WORDS if w.isascii())
+_POSITIVE_CJK_RE = re.compile("|".join(re.escape(w) for w in POSITIVE_WORDS if not w.isascii()))
+_NEGATIVE_CJK_RE = re.compile("|".join(re.escape(w) for w in NEGATIVE_WORDS if not w.isascii()))
+
+def _batch_sentiment(texts: List[str]) -> List[str]:
+    """批次判斷多則評論的情感；以分隔字元串接後整段掃描，再依位移對應回各則評論"""
+    # 先各自轉小寫再串接，避免少數字元轉小寫後長度改變造成位移錯位
+    lowered = [text.lower() for text in texts]
+    joined = "\x1f".join(lowered)
+    starts = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+    pos = [False] * len(texts)
+    neg = [False] * len(texts)
+    for m in _ASCII_WORD_RE.finditer(joined):
+        word = m.group()
+        if word in _POSITIVE_TOKENS:
+            pos[bisect_right(starts, m.start()) - 1] = True
+        elif word in _NEGATIVE_TOKENS:
+            neg[bisect_right(starts, m.start()) - 1] = True
+    for m in _POSITIVE_CJK_RE.finditer(joined):
+        pos[bisect_right(starts, m.start()) - 1] = True
+    for m in _NEGATIVE_CJK_RE.finditer(joined):
+        neg[bisect_right(starts, m.start()) - 1] = True
+    return [
+        'positive' if p and not n else 'negative' if n and not p else 'neutral'
+        for p, n in zip(pos, neg)
+    ]
+
+# JSON-LD 區塊含評論相關字樣才需要解析
+_LD_REVIEW_NEEDLE_RE = re.compile(r'review|aggregaterating', re.I)
+
+_LD_REVIEW_TYPES = frozenset(('review', 'aggregaterating'))
+
+def _iter_ld_items(data):
+    """逐一產生 JSON-LD 中的物件（單一物件或陣列），並展開 WordPress/Yoast 常見的 @graph 陣列"""
+    items = [data] if isinstance(data, dict) else data if isinstance(data, list) else []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        yield item
+        graph = item.get('@graph')
+        if isinstance(graph, list):
+            yield from (node for node in graph if isinstance(node, dict))
+
+def _ld_types(item: Dict) -> List[str]:
+    """取出 JSON-LD 物件的 @type（可能是字串或字串陣列），轉為小寫"""
+    value = item.get('@type')
+    values = value if isinstance(value, list) else [value]
+    return [str(t).lower() for t in values if t]
+
+def _snippet(node, limit: int = 200) -> str:
+    """取元素開頭約 limit 個字元的文字；逐段讀取，達到上限即停止，不必串接整棵子樹"""
+    parts = []
+    length = 0
+    for text in node.stripped_strings:
+        parts.append(text)
+        length += len(text) + 1
+        if length >= limit:
+            break
+    return ' '.join(parts)[:limit]
+
+def _is_review_block(tag) -> bool:
+    """class 或 id 含評論相關字樣的元素"""
+    classes = tag.get('class')
+    if classes and _REVIEW_CLASS_RE.search(' '.join(classes)):
+        return True
+    tag_id = tag.get('id')
+    return isinstance(tag_id, str) and _REVIEW_CLASS_RE.search(tag_id) is not None
+
+_FAQ_BLOCK_TAGS = frozenset(('div', 'section'))
+
+# 站內相對連結可接受的 scheme（空字串代表未指定）
+_WEB_SCHEMES = frozenset(('', 'http', 'https'))
+
+def _is_faq_block(tag) -> bool:
+    """class 含 FAQ／問答字樣的 div 或 section；整個 class 清單合併後只比對一次"""
+    if tag.name not in _FAQ_BLOCK_TAGS:
+        return False
+    classes = tag.get('class')
+    return bool(classes) and _FAQ_CLASS_RE.search(' '.join(classes)) is not None
+
+class Recommendation(NamedTuple):
+    """單筆改善建議的固定欄位紀錄（不可變，可在多次分析間共用）"""
+    issue: str
+    recommendation: str
+    priority: str
+    category: str
+
+# 備用改善建議規則（Gemini API 不可用時使用）：(判斷條件, 建議範本)。
+# 條件的參數依序為 root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis；
+# 範本為共用的 Recommendation，在輸出邊界才以 _asdict() 轉成與 Gemini 回應相同格式的 dict
+_POOR_OR_FAIR = frozenset(("poor", "fair"))
+FALLBACK_RULES: Tuple[Tuple[Callable[[Dict, Dict, Dict, Dict, Dict], bool], Recommendation], ...] = (
+    # Root Files 建議
+    (lambda rf, arch, llm, pa, faq: not rf["has_robots_txt"], Recommendation(
+        issue="缺少 robots.txt 檔案",
+        recommendation="請在網站根目錄建立 robots.txt 檔案，這是網站與搜尋引擎和 AI 機器人溝通的重要檔案。\n\n建議內容：\n```\nUser-agent: *\nAllow: /\nUser-agent: Google-Extended\nAllow: /\nUser-agent: GPTBot\nAllow: /\nUser-agent: anthropic-ai\nAllow: /\n\nSitemap: https://yourdomain.com/sitemap.xml\n```\n\n這將確保所有搜尋引擎和 AI 機器人都能正確存取您的網站內容。",
+        priority="High",
+        category="Root Files"
+    )),
+    (lambda rf, arch, llm, pa, faq: not rf["robots_allows_ai_bots"], Recommendation(
+        issue="robots.txt 封鎖 AI 機器人",
+        recommendation="請修改 robots.txt，確保允許 Google-Extended 與 GPTBot 等 AI User-Agent 進行存取。建議添加：User-agent: Google-Extended 和 Allow: /。",
+        priority="High",
+        category="Root Files"
+    )),
+    (lambda rf, arch, llm, pa, faq: not rf["has_sitemap_xml"], Recommendation(
+        issue="缺少 sitemap.xml 檔案",
+        recommendation="請建立 sitemap.xml 檔案，這是幫助搜尋引擎和 AI 理解網站結構的重要檔案。\n\n建議內容結構：\n```xml\n<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n  <url>\n    <loc>https://yourdomain.com/</loc>\n    <lastmod>2024-01-01</lastmod>\n    <changefreq>weekly</changefreq>\n    <priority>1.0</priority>\n  </url>\n  <url>\n    <loc>https://yourdomain.com/products</loc>\n    <lastmod>2024-01-01</lastmod>\n    <changefreq>weekly</changefreq>\n    <priority>0.8</priority>\n  </url>\n</urlset>\n```\n\n包含所有重要頁面，並定期更新以反映最新內容。",
+        priority="Medium",
+        category="Root Files"
+    )),
+    (lambda rf, arch, llm, pa, faq: not rf["sitemap_is_valid"], Recommendation(
+        issue="sitemap.xml 格式錯誤",
+        recommendation="請檢查 sitemap.xml 檔案格式，確保符合 XML 標準，包含正確的 URL 結構。",
+        priority="Medium",
+        category="Root Files"
+    )),
+    # Architecture 建議
+    (lambda rf, arch, llm, pa, faq: not arch["uses_https"], Recommendation(
+        issue="未使用 HTTPS 加密",
+        recommendation="請啟用 HTTPS 加密連線，這對網站安全性和搜尋引擎排名都很重要。可以透過 SSL 憑證提供商或 CDN 服務實現。",
+        priority="High",
+        category="Architecture"
+    )),
+    (lambda rf, arch, llm, pa, faq: arch["internal_link_structure"] == "poor", Recommendation(
+        issue="內部連結結構較差",
+        recommendation="請改善網站內部連結結構，確保主要頁面都有清晰的導航連結，這有助於 AI 理解網站內容關聯性。",
+        priority="Medium",
+        category="Architecture"
+    )),
+    # LLM Friendliness 建議
+    (lambda rf, arch, llm, pa, faq: not llm["schema_detected"], Recommendation(
+        issue="缺少結構化資料",
+        recommendation="請為網站添加 Schema.org 結構化資料，這對 AI 理解內容語義至關重要。建議實施以下標記：\n\n1. **組織標記 (Organization)**：包含公司名稱、logo、聯絡資訊\n2. **產品標記 (Product)**：包含產品名稱、描述、價格、規格\n3. **文章標記 (Article)**：包含標題、作者、發布日期\n4. **FAQ 標記 (FAQPage)**：包含問題和答案\n5. **麵包屑標記 (BreadcrumbList)**：顯示頁面層級結構\n\n實施方式：在 HTML 的 <head> 區塊中添加 <script type=\"application/ld+json\"> 標籤，包含結構化資料 JSON。這將大幅提升 AI 對網站內容的理解能力。",
+        priority="Medium",
+        category="LLM Friendliness"
+    )),
+    (lambda rf, arch, llm, pa, faq: llm["content_readability"] == "poor", Recommendation(
+        issue="內容結構較差",
+        recommendation="請改善內容結構，使用清晰的標題層級（H1, H2, H3）組織內容，確保內容邏輯清晰，便於 AI 理解。",
+        priority="Medium",
+        category="LLM Friendliness"
+    )),
+    (lambda rf, arch, llm, pa, faq: not llm["semantic_html"], Recommendation(
+        issue="未使用語義化 HTML",
+        recommendation="請使用語義化 HTML 標籤，這對 AI 理解內容結構至關重要。\n\n建議使用的標籤：\n- **<header>**：頁面或區塊的標題區域\n- **<nav>**：導航選單\n- **<main>**：主要內容區域\n- **<article>**：獨立的文章或產品內容\n- **<section>**：內容區塊\n- **<aside>**：側邊欄或相關內容\n- **<footer>**：頁面底部\n\n範例結構：\n```html\n<header>\n  <nav>導航選單</nav>\n</header>\n<main>\n  <article>\n    <section>產品介紹</section>\n    <section>技術規格</section>\n  </article>\n  <aside>相關產品</aside>\n</main>\n<footer>聯絡資訊</footer>\n```\n\n這將大幅提升 AI 對網站結構的理解能力。",
+        priority="Medium",
+        category="LLM Friendliness"
+    )),
+    (lambda rf, arch, llm, pa, faq: llm["content_hierarchy"] == "poor", Recommendation(
+        issue="內容層級結構較差",
+        recommendation="請改善內容層級結構，確保每個頁面有且僅有一個 H1 標題，並使用 H2、H3 等建立清晰的內容層級。",
+        priority="Medium",
+        category="LLM Friendliness"
+    )),
+    # Product Authority 建議
+    (lambda rf, arch, llm, pa, faq: pa["product_info_completeness"] in _POOR_OR_FAIR, Recommendation(
+        issue="產品資訊不完整",
+        recommendation="請完善產品資訊，包含詳細的技術規格、產品比較功能、專家評測、使用指南等內容，提升產品權威性。",
+        priority="Medium",
+        category="Product Authority"
+    )),
+    (lambda rf, arch, llm, pa, faq: pa["product_pages_found"] == 0, Recommendation(
+        issue="未發現產品相關頁面",
+        recommendation="請建立專門的產品頁面，包含產品介紹、規格、功能說明等內容，幫助消費者了解產品特性。",
+        priority="High",
+        category="Product Authority"
+    )),
+    (lambda rf, arch, llm, pa, faq: not pa["technical_specs_available"], Recommendation(
+        issue="缺少技術規格資訊",
+        recommendation="請為產品提供詳細的技術規格和參數，包括尺寸、重量、功率、功能特點等，提升產品資訊的專業性。",
+        priority="Medium",
+        category="Product Authority"
+    )),
+    # FAQ 建議
+    (lambda rf, arch, llm, pa, faq: not faq["faq_section_found"], Recommendation(
+        issue="缺少 FAQ 區塊",
+        recommendation="請建立 FAQ 區塊，回答消費者常見問題，這不僅能提升用戶體驗，也能增加網站內容的權威性。",
+        priority="Medium",
+        category="FAQ"
+    )),
+    (lambda rf, arch, llm, pa, faq: faq["qa_content_quality"] in _POOR_OR_FAIR, Recommendation(
+        issue="FAQ 內容品質較差",
+        recommendation="請改善 FAQ 內容品質，包含產品特定問題、使用問題、常見問題等，確保回答詳細且實用。",
+        priority="Medium",
+        category="FAQ"
+    )),
+    (lambda rf, arch, llm, pa, faq: not faq["product_specific_qa"], Recommendation(
+        issue="缺少產品特定問題解答",
+        recommendation="請在 FAQ 中包含產品特定的問題和解答，幫助消費者更好地了解產品使用方法和注意事項。",
+        priority="Medium",
+        category="FAQ"
+    )),
+)
+# 沒有發現任何問題時的一般性建議
+FALLBACK_GENERAL_RECOMMENDATION: Recommendation = Recommendation(
+    issue="網站基礎良好",
+    recommendation="您的網站基礎架構良好！建議持續監控 AI 就緒度指標，並考慮建立 llms.txt 檔案以適應未來 AI 搜尋需求。",
+    priority="Low",
+    category="General"
+)
+
+# SEO 與 LLM 友善度建議中固定不變的分類範本；建議清單為 tuple，輸出時複製外層 dict
+SEO_BASE_RECOMMENDATIONS: Mapping[str, object] = MappingProxyType({
+    "category": "SEO 基礎優化",
+    "recommendations": (
+        "建立完整的 XML Sitemap，包含所有重要頁面",
+        "優化 robots.txt，確保搜尋引擎和 AI 機器人正確存取",
+        "實施 HTTPS 加密，提升安全性和信任度",
+        "改善網站載入速度，優化 Core Web Vitals 指標"
+    )
+})
+LLM_BASE_RECOMMENDATIONS: Mapping[str, object] = MappingProxyType({
+    "category": "LLM 友善度優化",
+    "recommendations": (
+        "建立 llms.txt 檔案，明確告知 AI 模型如何處理網站內容",
+        "使用自然語言撰寫內容，避免過度優化關鍵字",
+        "提供完整的產品資訊和技術規格",
+        "建立 FAQ 區塊，回答消費者常見問題",
+        "使用內部連結建立內容關聯性",
+        "確保內容的可讀性和可理解性"
+    )
+})
+AUTHORITY_BASE_RECOMMENDATIONS: Mapping[str, object] = MappingProxyType({
+    "category": "產品權威性建立",
+    "recommendations": (
+        "提供詳細的產品技術規格和參數",
+        "建立產品比較功能，幫助消費者選擇",
+        "發布專家評測和使用指南",
+        "建立產品使用教學和維護指南",
+        "提供產品相關的專業知識內容"
+    )
+})
+FUTURE_BASE_RECOMMENDATIONS: Mapping[str, object] = MappingProxyType({
+    "category": "未來 LLM 收錄準備",
+    "recommendations": (
+        "建立完整的產品知識庫",
+        "提供結構化的產品資訊",
+        "使用標準化的內容格式",
+        "建立內容更新機制",
+        "監控 AI 模型對內容的存取和使用情況",
+        "準備適應未來 AI 搜尋演算法的內容策略"
+    )
+})
+
+@st.cache_resource(show_spinner=False)
+def _get_http_session() -> requests.Session:
+    """建立所有分析器共用的 HTTP session，跨重新執行與分析保留 keep-alive 連線池"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'SIE-Diagnostic-Tool/1.0 (contact@example.com)'
+    })
+    # session 由所有使用者與執行緒共用，不保存任何 cookie，避免目標網站為某位使用者設定的
+    # cookie 被帶到其他使用者的分析請求中；只共用連線池
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    # 連線池與重試：同一主機的根檔案與首頁共用 keep-alive 連線，暫時性 5xx 自動重試
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 class WebsiteAIReadinessAnalyzer:
     """網站 AI 就緒度與技術健康度分析器"""
     
-    def __init__(self, gemini_api_key: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SIE-Diagnostic-Tool/1.0 (contact@example.com)'
-        })
+    # 根檔案快取（所有分析器實例共用，跨 session 與執行緒存取）：
+    # (scheme, netloc) -> (抓取時間, {檔名: (狀態碼, 內容, 驗證標頭)})
+    _root_files_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Tuple[int, bytes, Dict[str, str]]]]] = {}
+    _root_files_cache_lock = threading.Lock()
+    # 頁面快取（所有分析器實例共用）：(正規化網址, 讀取上限) -> (抓取時間, 內容)；評論分頁會在多個執行緒中存取
+    _page_cache: Dict[Tuple[str, int], Tuple[float, bytes]] = {}
+    _page_cache_lock = threading.Lock()
+    
+    def __init__(self, gemini_api_key: Optional[str] = None, on_status: Optional[Callable[[str], None]] = None):
+        self.session = _get_http_session()
         
         # 初始化 Gemini API
         if gemini_api_key and GEMINI_AVAILABLE:
@@ -35,39 +584,79 @@ class WebsiteAIReadinessAnalyzer:
                 self.gemini_model = None
         else:
             self.gemini_model = None
+        
+        # 檢查過程的狀態訊息（markdown 行）：各項檢查只記錄訊息，本身不呼叫 st.*；
+        # on_status 在每則訊息產生時呼叫（皆在呼叫 analyze_website 的執行緒上），
+        # 由 run_website_analysis 即時寫入狀態框，快取命中時也能以同一份紀錄重現
+        self.status_lines: List[str] = []
+        self._on_status = on_status
+    
+    def _report(self, message: str) -> None:
+        """記錄一則檢查狀態訊息（訊息本身帶有 ✅/⚠️/ℹ️ 等圖示）"""
+        self.status_lines.append(message)
+        if self._on_status is not None:
+            self._on_status(message)
+    
+    def _begin_section(self, title: str) -> None:
+        """記錄新的檢查區段標題"""
+        self._report(f"**{title}**")
     
     def analyze_website(self, website_url: str, product_category: str = None, brand: Optional[str] = None, market: Optional[str] = None) -> Dict:
         """分析網站的 AI 就緒度與技術健康度"""
         if not website_url.startswith(('http://', 'https://')):
             website_url = 'https://' + website_url
         
-        st.info(f"🔍 正在分析網站: {website_url}")
-        
         try:
+            # 消費者旅程 FAQ 由 LLM 產生，與首頁抓取及各項檢查無關，先在背景送出，
+            # 讓 LLM 往返時間與後續的網路請求重疊
+            faq_future = None
+            if product_category and brand and market:
+                faq_executor = ThreadPoolExecutor(max_workers=1)
+                faq_future = faq_executor.submit(self._generate_faqs_with_llm, product_category, brand, market)
+                faq_executor.shutdown(wait=False)
+            
+            # 根檔案請求先在背景送出，與首頁下載同時進行
+            root_file_futures, root_files_fresh = self._fetch_root_files(website_url)
+            
+            # 首頁只抓取並解析一次，後續各項檢查共用同一份 soup；
+            # 首頁無法存取時其餘檢查都沒有意義，直接回傳錯誤
+            status_code, content = self._fetch_capped(website_url, HOMEPAGE_MAX_BYTES)
+            if status_code != 200:
+                self._report(f"❌ 首頁回應 HTTP {status_code}，無法進行分析")
+                return {"error": f"homepage HTTP {status_code}"}
+            soup = _parse_html(content, _HOMEPAGE_STRAINER)
+            # 首頁全文（小寫）同樣只計算一次
+            page_text = soup.get_text(separator='\n').lower()
+            
             # 1. 檢查根檔案與 LLM 遵從性
-            root_files = self._check_root_files(website_url)
+            root_files = self._check_root_files(website_url, root_file_futures, root_files_fresh)
             
             # 2. 檢查網站架構與權威信號
-            architecture_signals = self._check_architecture_signals(website_url)
+            architecture_signals = self._check_architecture_signals(website_url, soup)
             
             # 3. 檢查 LLM 友善度指標
-            llm_friendliness = self._check_llm_friendliness(website_url)
+            llm_friendliness = self._check_llm_friendliness(soup)
             
             # 4. 檢查產品品類權威性 (新增)
-            product_authority = self._check_product_category_authority(website_url, product_category)
+            product_authority = self._check_product_category_authority(soup, page_text, product_category)
             
             # 5. 檢查 FAQ 與消費者問題解答 (新增)
-            faq_analysis = self._check_faq_and_consumer_qa(website_url, product_category)
+            faq_analysis = self._check_faq_and_consumer_qa(soup, page_text, product_category)
+            
+            # 改善建議只取決於上述五項結果，先在背景請求 Gemini，與 FAQ 對應分析及評論抓取重疊
+            recommendations_future = self._submit_recommendations(
+                root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
+            )
             
             # 6. 新增消費者旅程FAQ對應分析
-            faq_journey_analysis = self._analyze_faq_journey(website_url, product_category, brand, market)
+            faq_journey_analysis = self._analyze_faq_journey(page_text, faq_future)
             
             # 7. 新增：用戶評論偵測
-            user_review_analysis = self._check_user_reviews(website_url)
+            user_review_analysis = self._check_user_reviews(website_url, soup)
             
             # 8. 生成 AI 改善建議
             actionable_recommendations = self._generate_recommendations(
-                root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
+                root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis, recommendations_future
             )
             
             # 9. 生成 SEO 與 LLM 友善度改善建議 (新增)
@@ -90,12 +679,35 @@ class WebsiteAIReadinessAnalyzer:
             }
             
         except Exception as e:
-            st.error(f"分析過程中發生錯誤: {str(e)}")
+            self._report(f"❌ 分析過程中發生錯誤: {str(e)}")
             return {"error": str(e)}
     
-    def _check_root_files(self, website_url: str) -> Dict:
-        """檢查根檔案與 LLM 遵從性"""
-        st.write("📁 檢查根檔案...")
+    def _fetch_root_files(self, website_url: str) -> Tuple[Dict[str, Future], bool]:
+        """送出三個根檔案的抓取請求（不等待完成），回傳 ({檔名: Future}, 是否為新抓取)"""
+        # 三個根檔案互不相依，同時送出請求，並與首頁下載重疊；
+        # 執行緒只負責抓取，狀態訊息仍在呼叫端的執行緒中依序記錄
+        # 同一主機的根檔案在 TTL 內直接沿用先前的抓取結果（包成已完成的 Future），過期後帶上先前的
+        # 驗證標頭重新請求，304 時沿用舊內容
+        with self._root_files_cache_lock:
+            cached = self._root_files_cache.get(tuple(urlparse(website_url)[:2]))
+        if cached and time.monotonic() - cached[0] < ROOT_FILES_CACHE_TTL_SECONDS:
+            futures = {}
+            for name, result in cached[1].items():
+                futures[name] = Future()
+                futures[name].set_result(result)
+            return futures, False
+        previous = cached[1] if cached else {}
+        executor = ThreadPoolExecutor(max_workers=len(ROOT_FILE_LIMITS))
+        futures = {
+            name: executor.submit(self._fetch_root_file, urljoin(website_url, f'/{name}'), max_bytes, previous.get(name))
+            for name, max_bytes in ROOT_FILE_LIMITS.items()
+        }
+        executor.shutdown(wait=False)
+        return futures, True
+    
+    def _check_root_files(self, website_url: str, futures: Dict[str, Future], fresh: bool) -> Dict:
+        """檢查根檔案與 LLM 遵從性；fresh 為 True 表示 futures 是新送出的抓取"""
+        self._begin_section("📁 檢查根檔案...")
         
         root_files = {
             "has_robots_txt": False,
@@ -106,60 +718,102 @@ class WebsiteAIReadinessAnalyzer:
             "llms_txt_content": None
         }
         
+        # 等待抓取完成；新抓取的結果全部成功才寫入快取（只保存結果本身），任一失敗則不快取
+        wait(futures.values())
+        if fresh and all(future.exception() is None for future in futures.values()):
+            host_key = tuple(urlparse(website_url)[:2])  # (scheme, netloc)
+            results = {name: future.result() for name, future in futures.items()}
+            with self._root_files_cache_lock:
+                self._root_files_cache.pop(host_key, None)
+                self._root_files_cache[host_key] = (time.monotonic(), results)
+                while len(self._root_files_cache) > ROOT_FILES_CACHE_MAX_HOSTS:
+                    self._root_files_cache.pop(next(iter(self._root_files_cache)))
+        
         # 檢查 robots.txt
         try:
-            robots_url = urljoin(website_url, '/robots.txt')
-            response = self.session.get(robots_url, timeout=10)
-            if response.status_code == 200:
+            status_code, content, _ = futures['robots.txt'].result()
+            if status_code == 200:
                 root_files["has_robots_txt"] = True
-                robots_content = response.text.lower()
-                
-                # 檢查是否允許 AI bots
-                ai_bots = ['google-extended', 'gptbot', 'anthropic-ai', 'claude-ai']
-                blocked_ai_bots = []
-                for bot in ai_bots:
-                    if f'user-agent: {bot}' in robots_content and 'disallow: /' in robots_content:
-                        blocked_ai_bots.append(bot)
+                # 依 User-agent 區段解析規則（沒有專屬區段的爬蟲套用 * 的規則），檢查是否允許 AI bots
+                robots_parser = _parse_robots(content)
+                blocked_ai_bots = [bot for bot in AI_BOTS if not robots_parser.can_fetch(bot, website_url)]
                 
                 root_files["robots_allows_ai_bots"] = len(blocked_ai_bots) == 0
                 if blocked_ai_bots:
-                    st.warning(f"⚠️ robots.txt 封鎖了 AI bots: {', '.join(blocked_ai_bots)}")
+                    self._report(f"⚠️ robots.txt 封鎖了 AI bots: {', '.join(blocked_ai_bots)}")
                 else:
-                    st.success("✅ robots.txt 允許 AI bots 存取")
+                    self._report("✅ robots.txt 允許 AI bots 存取")
         except Exception as e:
-            st.warning(f"⚠️ 無法讀取 robots.txt: {str(e)}")
+            self._report(f"⚠️ 無法讀取 robots.txt: {str(e)}")
         
         # 檢查 sitemap.xml
         try:
-            sitemap_url = urljoin(website_url, '/sitemap.xml')
-            response = self.session.get(sitemap_url, timeout=10)
-            if response.status_code == 200:
+            status_code, content, _ = futures['sitemap.xml'].result()
+            if status_code == 200:
                 root_files["has_sitemap_xml"] = True
-                # 簡單驗證 XML 格式
-                if '<?xml' in response.text and '<urlset' in response.text:
+                # 驗證 XML 格式：只解析到根元素為止，根元素須為 urlset 或 sitemapindex
+                if _sitemap_root_is_valid(content):
                     root_files["sitemap_is_valid"] = True
-                    st.success("✅ sitemap.xml 存在且格式正確")
+                    self._report("✅ sitemap.xml 存在且格式正確")
                 else:
-                    st.warning("⚠️ sitemap.xml 格式可能有問題")
+                    self._report("⚠️ sitemap.xml 格式可能有問題")
         except Exception as e:
-            st.warning(f"⚠️ 無法讀取 sitemap.xml: {str(e)}")
+            self._report(f"⚠️ 無法讀取 sitemap.xml: {str(e)}")
         
         # 檢查 llms.txt (前瞻性指標)
         try:
-            llms_url = urljoin(website_url, '/llms.txt')
-            response = self.session.get(llms_url, timeout=10)
-            if response.status_code == 200:
+            status_code, content, _ = futures['llms.txt'].result()
+            if status_code == 200:
                 root_files["has_llms_txt"] = True
-                root_files["llms_txt_content"] = response.text
-                st.success("✅ llms.txt 存在 (前瞻性指標)")
+                root_files["llms_txt_content"] = _decode(content)
+                self._report("✅ llms.txt 存在 (前瞻性指標)")
         except Exception as e:
-            st.info("ℹ️ llms.txt 不存在 (這是正常的，目前仍是新興標準)")
+            self._report("ℹ️ llms.txt 不存在 (這是正常的，目前仍是新興標準)")
         
         return root_files
     
-    def _check_architecture_signals(self, website_url: str) -> Dict:
+    def _fetch_capped(self, url: str, max_bytes: int) -> Tuple[int, bytes]:
+        """以串流方式抓取，最多讀取 max_bytes，回傳 (狀態碼, 內容)；成功的回應在 PAGE_CACHE_TTL_SECONDS 內直接沿用"""
+        cache_key = (_normalize_url(url), max_bytes)
+        with self._page_cache_lock:
+            cached = self._page_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < PAGE_CACHE_TTL_SECONDS:
+            return 200, cached[1]
+        with self.session.get(url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, b''
+            content = response.raw.read(max_bytes, decode_content=True)
+        with self._page_cache_lock:
+            self._page_cache.pop(cache_key, None)
+            self._page_cache[cache_key] = (time.monotonic(), content)
+            while len(self._page_cache) > PAGE_CACHE_MAX_ENTRIES:
+                self._page_cache.pop(next(iter(self._page_cache)))
+        return 200, content
+    
+    def _fetch_root_file(self, url: str, max_bytes: int, previous: Optional[Tuple[int, bytes, Dict[str, str]]] = None) -> Tuple[int, bytes, Dict[str, str]]:
+        """抓取根檔案，回傳 (狀態碼, 內容, 驗證標頭)；有先前結果時送出條件請求，304 時沿用先前結果。
+        以 Range 只請求前 max_bytes 位元組，支援的伺服器回傳 206 時視同 200；
+        空檔案無法滿足 Range，伺服器回傳 416 時視為內容為空的 200"""
+        headers = {'Range': f'bytes=0-{max_bytes - 1}'}
+        if previous:
+            validators = previous[2]
+            if 'ETag' in validators:
+                headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                headers['If-Modified-Since'] = validators['Last-Modified']
+        with self.session.get(url, timeout=10, stream=True, headers=headers) as response:
+            if response.status_code == 304 and previous:
+                return previous
+            if response.status_code == 416:
+                return 200, b'', {}
+            if response.status_code not in (200, 206):
+                return response.status_code, b'', {}
+            validators = {name: response.headers[name] for name in ('ETag', 'Last-Modified') if name in response.headers}
+            return 200, response.raw.read(max_bytes, decode_content=True), validators
+    
+    def _check_architecture_signals(self, website_url: str, soup: BeautifulSoup) -> Dict:
         """檢查網站架構與權威信號"""
-        st.write("🏗️ 檢查網站架構...")
+        self._begin_section("🏗️ 檢查網站架構...")
         
         architecture_signals = {
             "uses_https": False,
@@ -171,51 +825,50 @@ class WebsiteAIReadinessAnalyzer:
         # 檢查 HTTPS
         if website_url.startswith('https://'):
             architecture_signals["uses_https"] = True
-            st.success("✅ 網站使用 HTTPS")
+            self._report("✅ 網站使用 HTTPS")
         else:
-            st.warning("⚠️ 網站未使用 HTTPS")
+            self._report("⚠️ 網站未使用 HTTPS")
         
         # 檢查內部連結結構
         try:
-            response = self.session.get(website_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 檢查導航連結
-                nav_links = soup.find_all('a', href=True)
-                internal_links = []
-                for link in nav_links:
-                    href = link.get('href')
-                    if isinstance(href, str) and (href.startswith('/') or (website_url in href)):
-                        internal_links.append(link)
-                
-                if len(internal_links) >= 5:
-                    architecture_signals["internal_link_structure"] = "good"
-                    st.success("✅ 內部連結結構良好")
-                elif len(internal_links) >= 2:
-                    architecture_signals["internal_link_structure"] = "fair"
-                    st.info("ℹ️ 內部連結結構一般")
+            # 檢查導航連結：一次迴圈同時統計內部與外部連結數量；
+            # 以主機名稱判斷是否為站內連結，避免網址僅以子字串出現在 href 中時被誤判；
+            # 沒有主機名稱的相對連結（page.html、?page=2）也屬站內，mailto:、javascript: 等則否
+            nav_links = soup.find_all('a', href=True)
+            site_netloc = urlparse(website_url).netloc
+            internal_count = external_count = 0
+            for link in nav_links:
+                href = link.get('href')
+                if not isinstance(href, str):
+                    continue
+                parsed_href = urlparse(href)
+                if parsed_href.netloc == site_netloc or (not parsed_href.netloc and parsed_href.scheme in _WEB_SCHEMES):
+                    internal_count += 1
                 else:
-                    architecture_signals["internal_link_structure"] = "poor"
-                    st.warning("⚠️ 內部連結結構較差")
-                
-                # 估算外部權威連結 (模擬)
-                architecture_signals["estimated_authority_links"] = len(nav_links) // 10
-                external_links = []
-                for link in nav_links:
-                    href = link.get('href')
-                    if isinstance(href, str) and not href.startswith('/') and website_url not in href:
-                        external_links.append(link)
-                architecture_signals["external_links_count"] = len(external_links)
-                
+                    external_count += 1
+            
+            if internal_count >= 5:
+                architecture_signals["internal_link_structure"] = "good"
+                self._report("✅ 內部連結結構良好")
+            elif internal_count >= 2:
+                architecture_signals["internal_link_structure"] = "fair"
+                self._report("ℹ️ 內部連結結構一般")
+            else:
+                architecture_signals["internal_link_structure"] = "poor"
+                self._report("⚠️ 內部連結結構較差")
+            
+            # 估算外部權威連結 (模擬)
+            architecture_signals["estimated_authority_links"] = len(nav_links) // 10
+            architecture_signals["external_links_count"] = external_count
+            
         except Exception as e:
-            st.warning(f"⚠️ 無法分析網站架構: {str(e)}")
+            self._report(f"⚠️ 無法分析網站架構: {str(e)}")
         
         return architecture_signals
     
-    def _check_llm_friendliness(self, website_url: str) -> Dict:
+    def _check_llm_friendliness(self, soup: BeautifulSoup) -> Dict:
         """檢查 LLM 友善度指標"""
-        st.write("🤖 檢查 LLM 友善度...")
+        self._begin_section("🤖 檢查 LLM 友善度...")
         
         llm_friendliness = {
             "schema_detected": [],
@@ -230,84 +883,96 @@ class WebsiteAIReadinessAnalyzer:
         }
         
         try:
-            response = self.session.get(website_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 檢查 Schema.org 結構化資料
-                schema_scripts = soup.find_all('script', type='application/ld+json')
-                schema_types = []
-                for script in schema_scripts:
-                    try:
-                        if script.string is None:
-                            continue
-                        schema_data = json.loads(script.string)
-                        if isinstance(schema_data, dict):
-                            schema_type = schema_data.get('@type', 'Unknown')
-                            schema_types.append(schema_type)
-                    except:
-                        continue
-                
-                llm_friendliness["schema_detected"] = list(set(schema_types))
-                llm_friendliness["structured_data_score"] = len(schema_types)
-                
-                if schema_types:
-                    st.success(f"✅ 發現結構化資料: {', '.join(schema_types)}")
-                else:
-                    st.warning("⚠️ 未發現結構化資料")
-                
-                # 檢查內容可讀性
-                headings = soup.find_all(['h1', 'h2', 'h3'])
-                paragraphs = soup.find_all('p')
-                
-                if len(headings) >= 3 and len(paragraphs) >= 5:
-                    llm_friendliness["content_readability"] = "good"
-                    st.success("✅ 內容結構良好，有清晰的標題層級")
-                elif len(headings) >= 1 and len(paragraphs) >= 2:
-                    llm_friendliness["content_readability"] = "fair"
-                    st.info("ℹ️ 內容結構一般")
-                else:
-                    llm_friendliness["content_readability"] = "poor"
-                    st.warning("⚠️ 內容結構較差，缺乏清晰的標題層級")
-                
-                # 檢查語義化 HTML
-                semantic_elements = soup.find_all(['article', 'section', 'nav', 'header', 'footer', 'main', 'aside'])
-                llm_friendliness["semantic_html"] = len(semantic_elements) > 0
-                
-                if llm_friendliness["semantic_html"]:
-                    st.success("✅ 使用語義化 HTML 標籤")
-                else:
-                    st.warning("⚠️ 未使用語義化 HTML 標籤")
-                
-                # 檢查內容層級結構
-                h1_count = len(soup.find_all('h1'))
-                h2_count = len(soup.find_all('h2'))
-                h3_count = len(soup.find_all('h3'))
-                
-                if h1_count == 1 and h2_count > 0:
-                    llm_friendliness["content_hierarchy"] = "good"
-                    st.success("✅ 內容層級結構良好")
-                elif h1_count > 0:
-                    llm_friendliness["content_hierarchy"] = "fair"
-                    st.info("ℹ️ 內容層級結構一般")
-                else:
-                    llm_friendliness["content_hierarchy"] = "poor"
-                    st.warning("⚠️ 內容層級結構較差")
-                
-                # 模擬 PageSpeed 分數 (實際應用中應使用 Google PageSpeed Insights API)
-                llm_friendliness["pagespeed_scores"] = {
-                    "mobile": {"performance": 75, "lcp": 2.1, "cls": 0.05},
-                    "desktop": {"performance": 92, "lcp": 1.5, "cls": 0.01}
-                }
-                
+            # 單次走訪 DOM：統計各標籤數量，並同時收集 JSON-LD 區塊，供結構化資料、可讀性、語義化與層級檢查共用
+            tag_counts = Counter()
+            ld_scripts = []
+            for tag in soup.find_all(True):
+                tag_counts[tag.name] += 1
+                if tag.name == 'script' and tag.get('type') == 'application/ld+json':
+                    ld_scripts.append(tag)
+            
+            # 檢查 Schema.org 結構化資料
+            # JSON-LD 可能是單一物件、陣列或 @graph，逐一展開每個節點；@type 可能是字串陣列
+            # 分數沿用原本的定義：每個頂層為物件的 JSON-LD 區塊計一分；陣列與 @graph 展開只用於偵測類型
+            schema_types = {}  # 依出現順序去重的 @type
+            structured_data_score = 0
+            for script in ld_scripts:
+                # 空白或模板佔位字串不是 JSON，先略過，避免為每個區塊建立解析例外
+                # get_text() 在區塊含多個文字節點時仍能取得完整內容（.string 會回傳 None）
+                raw = script.get_text().strip()
+                if not raw.startswith(('{', '[')):
+                    continue
+                try:
+                    schema_data = _json_loads(raw)
+                except ValueError:  # json / orjson 的 JSONDecodeError 皆為 ValueError 子類別
+                    continue
+                if isinstance(schema_data, dict):
+                    structured_data_score += 1
+                for item in _iter_ld_items(schema_data):
+                    schema_type = item.get('@type')
+                    if schema_type is None and '@graph' in item:
+                        continue  # @graph 外層容器本身不是節點
+                    for t in (schema_type if isinstance(schema_type, list) else [schema_type or 'Unknown']):
+                        schema_types[str(t)] = None
+            
+            llm_friendliness["schema_detected"] = list(schema_types)
+            llm_friendliness["structured_data_score"] = structured_data_score
+            
+            if schema_types:
+                self._report(f"✅ 發現結構化資料: {', '.join(schema_types)}")
+            else:
+                self._report("⚠️ 未發現結構化資料")
+            
+            h1_count = tag_counts['h1']
+            h2_count = tag_counts['h2']
+            h3_count = tag_counts['h3']
+            heading_count = h1_count + h2_count + h3_count
+            paragraph_count = tag_counts['p']
+            
+            # 檢查內容可讀性
+            if heading_count >= 3 and paragraph_count >= 5:
+                llm_friendliness["content_readability"] = "good"
+                self._report("✅ 內容結構良好，有清晰的標題層級")
+            elif heading_count >= 1 and paragraph_count >= 2:
+                llm_friendliness["content_readability"] = "fair"
+                self._report("ℹ️ 內容結構一般")
+            else:
+                llm_friendliness["content_readability"] = "poor"
+                self._report("⚠️ 內容結構較差，缺乏清晰的標題層級")
+            
+            # 檢查語義化 HTML
+            llm_friendliness["semantic_html"] = any(tag_counts[tag] for tag in SEMANTIC_TAGS)
+            
+            if llm_friendliness["semantic_html"]:
+                self._report("✅ 使用語義化 HTML 標籤")
+            else:
+                self._report("⚠️ 未使用語義化 HTML 標籤")
+            
+            # 檢查內容層級結構
+            if h1_count == 1 and h2_count > 0:
+                llm_friendliness["content_hierarchy"] = "good"
+                self._report("✅ 內容層級結構良好")
+            elif h1_count > 0:
+                llm_friendliness["content_hierarchy"] = "fair"
+                self._report("ℹ️ 內容層級結構一般")
+            else:
+                llm_friendliness["content_hierarchy"] = "poor"
+                self._report("⚠️ 內容層級結構較差")
+            
+            # 模擬 PageSpeed 分數 (實際應用中應使用 Google PageSpeed Insights API)
+            llm_friendliness["pagespeed_scores"] = {
+                "mobile": {"performance": 75, "lcp": 2.1, "cls": 0.05},
+                "desktop": {"performance": 92, "lcp": 1.5, "cls": 0.01}
+            }
+            
         except Exception as e:
-            st.warning(f"⚠️ 無法分析 LLM 友善度: {str(e)}")
+            self._report(f"⚠️ 無法分析 LLM 友善度: {str(e)}")
         
         return llm_friendliness
     
-    def _check_product_category_authority(self, website_url: str, product_category: str = None) -> Dict:
+    def _check_product_category_authority(self, soup: BeautifulSoup, page_text: str, product_category: str = None) -> Dict:
         """檢查產品品類權威性"""
-        st.write("🏆 檢查產品品類權威性...")
+        self._begin_section("🏆 檢查產品品類權威性...")
         
         product_authority = {
             "product_pages_found": 0,
@@ -319,110 +984,74 @@ class WebsiteAIReadinessAnalyzer:
         }
         
         if not product_category:
-            st.info("ℹ️ 未指定產品品類，跳過產品權威性檢查")
+            self._report("ℹ️ 未指定產品品類，跳過產品權威性檢查")
             return product_authority
         
         try:
-            response = self.session.get(website_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            # 搜尋產品相關頁面：品類名稱與相關關鍵字合併為單一模式，每個連結只需各掃描一次文字與 href
+            keyword_re = _authority_keyword_re(product_category)
+            
+            # 檢查產品頁面
+            product_links = [
+                link for link in soup.find_all('a', href=True)
+                if keyword_re.search(link.get_text()) or keyword_re.search(link.get('href') or '')
+            ]
+            
+            product_authority["product_pages_found"] = len(product_links)
+            
+            if product_links:
+                self._report(f"✅ 發現 {len(product_links)} 個產品相關頁面")
                 
-                # 搜尋產品相關頁面
-                product_keywords = [product_category.lower()]
+                # 檢查產品資訊完整性：技術規格、比較功能、專家內容一次掃描
+                signals = _scan_signals(_PRODUCT_SIGNAL_RE, page_text)
                 
-                # 根據產品品類添加相關關鍵字
-                if product_category == "除濕機":
-                    product_keywords.extend(["dehumidifier", "除濕", "乾燥", "濕度"])
-                elif product_category == "冷氣":
-                    product_keywords.extend(["air conditioner", "冷氣", "空調", "製冷"])
-                elif product_category == "洗衣機":
-                    product_keywords.extend(["washing machine", "洗衣", "洗滌"])
-                elif product_category == "冰箱":
-                    product_keywords.extend(["refrigerator", "冰箱", "冷藏", "冷凍"])
-                elif product_category == "電視":
-                    product_keywords.extend(["tv", "television", "電視", "顯示器"])
-                elif product_category == "手機":
-                    product_keywords.extend(["mobile", "phone", "smartphone", "手機", "智慧型手機"])
-                elif product_category == "筆電":
-                    product_keywords.extend(["laptop", "notebook", "筆電", "筆記型電腦"])
-                elif product_category == "平板":
-                    product_keywords.extend(["tablet", "ipad", "平板", "平板電腦"])
-                elif product_category == "相機":
-                    product_keywords.extend(["camera", "相機", "攝影", "拍照"])
-                elif product_category == "音響":
-                    product_keywords.extend(["speaker", "audio", "音響", "喇叭"])
-                else:
-                    # 對於其他產品，添加一些通用的產品相關關鍵字
-                    product_keywords.extend(["產品", "product", "規格", "specification", "功能", "feature"])
+                # 檢查技術規格
+                if "tech_specs" in signals:
+                    product_authority["technical_specs_available"] = True
+                    self._report("✅ 發現技術規格資訊")
                 
-                # 檢查產品頁面
-                product_links = []
-                for link in soup.find_all('a', href=True):
-                    link_text = link.get_text().lower()
-                    href = link.get('href').lower() if link.get('href') else ''
-                    for keyword in product_keywords:
-                        if keyword in link_text or keyword in href:
-                            product_links.append(link)
-                            break
+                # 檢查比較功能
+                if "comparison" in signals:
+                    product_authority["comparison_features"] = True
+                    self._report("✅ 發現產品比較功能")
                 
-                product_authority["product_pages_found"] = len(product_links)
+                # 檢查專家內容
+                if "expert" in signals:
+                    product_authority["expert_content"] = True
+                    self._report("✅ 發現專家內容")
                 
-                if product_links:
-                    st.success(f"✅ 發現 {len(product_links)} 個產品相關頁面")
-                    
-                    # 檢查產品資訊完整性
-                    page_text = soup.get_text().lower()
-                    
-                    # 檢查技術規格
-                    tech_specs_keywords = ["規格", "specification", "技術", "technical", "參數", "parameter"]
-                    if any(keyword in page_text for keyword in tech_specs_keywords):
-                        product_authority["technical_specs_available"] = True
-                        st.success("✅ 發現技術規格資訊")
-                    
-                    # 檢查比較功能
-                    comparison_keywords = ["比較", "compare", "對比", "vs", "versus"]
-                    if any(keyword in page_text for keyword in comparison_keywords):
-                        product_authority["comparison_features"] = True
-                        st.success("✅ 發現產品比較功能")
-                    
-                    # 檢查專家內容
-                    expert_keywords = ["專家", "expert", "專業", "professional", "評測", "review"]
-                    if any(keyword in page_text for keyword in expert_keywords):
-                        product_authority["expert_content"] = True
-                        st.success("✅ 發現專家內容")
-                    
-                    # 計算權威分數
-                    score = 0
-                    score += len(product_links) * 10
-                    if product_authority["technical_specs_available"]:
-                        score += 20
-                    if product_authority["comparison_features"]:
-                        score += 15
-                    if product_authority["expert_content"]:
-                        score += 15
-                    
-                    product_authority["authority_score"] = min(score, 100)
-                    
-                    if score >= 60:
-                        product_authority["product_info_completeness"] = "excellent"
-                    elif score >= 40:
-                        product_authority["product_info_completeness"] = "good"
-                    elif score >= 20:
-                        product_authority["product_info_completeness"] = "fair"
-                    else:
-                        product_authority["product_info_completeness"] = "poor"
-                        
+                # 計算權威分數
+                score = 0
+                score += len(product_links) * 10
+                if product_authority["technical_specs_available"]:
+                    score += 20
+                if product_authority["comparison_features"]:
+                    score += 15
+                if product_authority["expert_content"]:
+                    score += 15
+                
+                product_authority["authority_score"] = min(score, 100)
+                
+                if score >= 60:
+                    product_authority["product_info_completeness"] = "excellent"
+                elif score >= 40:
+                    product_authority["product_info_completeness"] = "good"
+                elif score >= 20:
+                    product_authority["product_info_completeness"] = "fair"
                 else:
-                    st.warning(f"⚠️ 未發現 {product_category} 相關產品頁面")
+                    product_authority["product_info_completeness"] = "poor"
                     
+            else:
+                self._report(f"⚠️ 未發現 {product_category} 相關產品頁面")
+                
         except Exception as e:
-            st.warning(f"⚠️ 無法分析產品權威性: {str(e)}")
+            self._report(f"⚠️ 無法分析產品權威性: {str(e)}")
         
         return product_authority
     
-    def _check_faq_and_consumer_qa(self, website_url: str, product_category: str = None) -> Dict:
+    def _check_faq_and_consumer_qa(self, soup: BeautifulSoup, page_text: str, product_category: str = None) -> Dict:
         """檢查 FAQ 與消費者問題解答"""
-        st.write("❓ 檢查 FAQ 與消費者問題解答...")
+        self._begin_section("❓ 檢查 FAQ 與消費者問題解答...")
         
         faq_analysis = {
             "faq_section_found": False,
@@ -434,133 +1063,89 @@ class WebsiteAIReadinessAnalyzer:
         }
         
         try:
-            response = self.session.get(website_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            # 搜尋 FAQ 相關元素
+            # 檢查標題中的 FAQ
+            faq_elements = [
+                heading for heading in soup.find_all(['h1', 'h2', 'h3', 'h4'])
+                if _FAQ_HEADING_RE.search(heading.get_text())
+            ]
+            
+            # 檢查 FAQ 區塊
+            faq_sections = soup.find_all(_is_faq_block)
+            faq_elements.extend(faq_sections)
+            
+            if faq_elements:
+                faq_analysis["faq_section_found"] = True
+                faq_analysis["faq_count"] = len(faq_elements)
+                self._report(f"✅ 發現 FAQ 區塊，包含 {len(faq_elements)} 個問題")
                 
-                # 搜尋 FAQ 相關元素
-                faq_keywords = ["faq", "常見問題", "frequently asked", "q&a", "問答"]
-                faq_elements = []
+                # 檢查產品特定問題
+                if product_category:
+                    if _faq_keyword_re(product_category).search(page_text):
+                        faq_analysis["product_specific_qa"] = True
+                        self._report("✅ 發現產品特定問題解答")
                 
-                # 檢查標題中的 FAQ
-                for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-                    heading_text = heading.get_text().lower()
-                    if any(keyword in heading_text for keyword in faq_keywords):
-                        faq_elements.append(heading)
+                # 檢查常見問題覆蓋度
+                question_count = sum(
+                    1 for element in faq_elements
+                    if _COMMON_QUESTION_RE.search(element.get_text().lower())
+                )
                 
-                # 檢查 FAQ 區塊
-                faq_sections = soup.find_all(['div', 'section'], class_=re.compile(r'faq|question|answer', re.I))
-                faq_elements.extend(faq_sections)
+                if question_count >= 3:
+                    faq_analysis["common_questions_covered"] = True
+                    self._report("✅ 覆蓋多個常見問題類型")
                 
-                if faq_elements:
-                    faq_analysis["faq_section_found"] = True
-                    faq_analysis["faq_count"] = len(faq_elements)
-                    st.success(f"✅ 發現 FAQ 區塊，包含 {len(faq_elements)} 個問題")
-                    
-                    # 檢查產品特定問題
-                    if product_category:
-                        page_text = soup.get_text().lower()
-                        product_keywords = [product_category.lower()]
-                        
-                        # 根據產品品類添加相關關鍵字
-                        if product_category == "除濕機":
-                            product_keywords.extend(["除濕", "濕度", "乾燥", "冷凝"])
-                        elif product_category == "冷氣":
-                            product_keywords.extend(["冷氣", "空調", "製冷", "溫度"])
-                        elif product_category == "洗衣機":
-                            product_keywords.extend(["洗衣", "洗滌", "清潔"])
-                        elif product_category == "冰箱":
-                            product_keywords.extend(["冰箱", "冷藏", "冷凍", "保鮮"])
-                        elif product_category == "電視":
-                            product_keywords.extend(["電視", "顯示器", "螢幕"])
-                        elif product_category == "手機":
-                            product_keywords.extend(["手機", "智慧型手機", "通話", "app"])
-                        elif product_category == "筆電":
-                            product_keywords.extend(["筆電", "筆記型電腦", "電腦", "處理器"])
-                        elif product_category == "平板":
-                            product_keywords.extend(["平板", "平板電腦", "觸控"])
-                        elif product_category == "相機":
-                            product_keywords.extend(["相機", "攝影", "拍照", "鏡頭"])
-                        elif product_category == "音響":
-                            product_keywords.extend(["音響", "喇叭", "音樂", "音質"])
-                        else:
-                            # 對於其他產品，添加一些通用的產品相關關鍵字
-                            product_keywords.extend(["產品", "使用", "功能", "問題"])
-                        
-                        if any(keyword in page_text for keyword in product_keywords):
-                            faq_analysis["product_specific_qa"] = True
-                            st.success("✅ 發現產品特定問題解答")
-                    
-                    # 檢查常見問題覆蓋度
-                    common_questions = [
-                        "如何", "怎麼", "為什麼", "什麼時候", "哪裡", "多少錢",
-                        "how", "why", "when", "where", "what", "price", "cost"
-                    ]
-                    
-                    question_count = 0
-                    for element in faq_elements:
-                        element_text = element.get_text().lower()
-                        for question in common_questions:
-                            if question in element_text:
-                                question_count += 1
-                                break
-                    
-                    if question_count >= 3:
-                        faq_analysis["common_questions_covered"] = True
-                        st.success("✅ 覆蓋多個常見問題類型")
-                    
-                    # 評估 QA 內容品質
-                    score = 0
-                    score += len(faq_elements) * 5
-                    if faq_analysis["product_specific_qa"]:
-                        score += 20
-                    if faq_analysis["common_questions_covered"]:
-                        score += 15
-                    
-                    faq_analysis["qa_score"] = min(score, 100)
-                    
-                    if score >= 50:
-                        faq_analysis["qa_content_quality"] = "excellent"
-                    elif score >= 30:
-                        faq_analysis["qa_content_quality"] = "good"
-                    elif score >= 15:
-                        faq_analysis["qa_content_quality"] = "fair"
-                    else:
-                        faq_analysis["qa_content_quality"] = "poor"
-                        
+                # 評估 QA 內容品質
+                score = 0
+                score += len(faq_elements) * 5
+                if faq_analysis["product_specific_qa"]:
+                    score += 20
+                if faq_analysis["common_questions_covered"]:
+                    score += 15
+                
+                faq_analysis["qa_score"] = min(score, 100)
+                
+                if score >= 50:
+                    faq_analysis["qa_content_quality"] = "excellent"
+                elif score >= 30:
+                    faq_analysis["qa_content_quality"] = "good"
+                elif score >= 15:
+                    faq_analysis["qa_content_quality"] = "fair"
                 else:
-                    st.warning("⚠️ 未發現 FAQ 區塊")
+                    faq_analysis["qa_content_quality"] = "poor"
                     
+            else:
+                self._report("⚠️ 未發現 FAQ 區塊")
+                
         except Exception as e:
-            st.warning(f"⚠️ 無法分析 FAQ: {str(e)}")
+            self._report(f"⚠️ 無法分析 FAQ: {str(e)}")
         
         return faq_analysis
     
-    def _analyze_faq_journey(self, website_url: str, product_category: Optional[str], brand: Optional[str], market: Optional[str]) -> Dict:
+    def _analyze_faq_journey(self, page_text: str, faq_future: Optional[Future]) -> Dict:
         """
-        產生中英文FAQ，並比對網站內容是否有覆蓋，標註權威性。
+        取得背景產生的中英文FAQ，並比對網站內容是否有覆蓋，標註權威性。
+        faq_future 為 None 表示缺少品類、品牌或市場資訊。
         """
-        if not (product_category and brand and market):
+        if faq_future is None:
             return {"error": "缺少品類、品牌或市場資訊，無法進行FAQ對應分析。"}
         
-        # 1. 產生FAQ（中英文）
-        faqs = self._generate_faqs_with_llm(product_category, brand, market)
+        # 1. 取得FAQ（中英文）
+        faqs = faq_future.result()
         
-        # 2. 取得網站內容
-        try:
-            response = requests.get(website_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                page_text = soup.get_text(separator='\n').lower()
-            else:
-                page_text = ""
-        except Exception:
-            page_text = ""
+        # 2. 比對FAQ是否有覆蓋（網站內容沿用已計算的首頁全文）
+        # 出現位置與權威性只取決於頁面本身，整頁只判斷一次，不必每個 FAQ 重新掃描
+        if "faq" in page_text:
+            page_location = "FAQ"
+        elif "產品" in page_text or "product" in page_text:
+            page_location = "產品頁"
+        else:
+            page_location = "首頁/其他"
+        page_has_authority = bool(_AUTHORITY_RE.search(page_text))
         
-        # 3. 比對FAQ是否有覆蓋
         results = []
         for faq in faqs:
-            found, location, authority = self._check_faq_coverage(faq, page_text)
+            found, location, authority = self._check_faq_coverage(faq, page_text, page_location, page_has_authority)
             results.append({
                 "question_zh": faq["zh"],
                 "question_en": faq["en"],
@@ -574,16 +1159,8 @@ class WebsiteAIReadinessAnalyzer:
         """
         用 LLM 產生中英文FAQ，回傳格式：[{"zh": ..., "en": ...}, ...]
         """
-        if not self.gemini_model:
-            # 備用範例
-            return [
-                {"zh": f"{product_category}的耗電量是多少？", "en": f"What is the power consumption of the {product_category}?"},
-                {"zh": f"如何選擇適合房間大小的{product_category}？", "en": f"How to choose the right {product_category} for room size?"},
-                {"zh": f"{product_category}保固多久？", "en": f"What is the warranty period of the {product_category}?"},
-                {"zh": f"{product_category}遇到異常聲音怎麼辦？", "en": f"What to do if the {product_category} makes abnormal noise?"},
-                {"zh": f"{product_category}是否有自動斷電功能？", "en": f"Does the {product_category} have an auto power-off function?"}
-            ]
-        prompt = f"""
+        if self.gemini_model:
+            prompt = f"""
 請根據下列資訊，列出消費者最常詢問{brand}品牌在{market}市場的{product_category}產品的10個常見問題，並給出每題的英文翻譯：
 請以JSON格式回傳：
 [
@@ -591,78 +1168,60 @@ class WebsiteAIReadinessAnalyzer:
   ...
 ]
 """
-        response = self.gemini_model.generate_content(prompt)
-        try:
-            text = response.text.strip()
-            if text.startswith('```json'):
-                text = text[7:]
-            if text.endswith('```'):
-                text = text[:-3]
-            text = text.strip()
-            faqs = json.loads(text)
-            return faqs[:10]
-        except Exception:
-            # 若解析失敗，回傳備用範例
-            return [
-                {"zh": f"{product_category}的耗電量是多少？", "en": f"What is the power consumption of the {product_category}?"},
-                {"zh": f"如何選擇適合房間大小的{product_category}？", "en": f"How to choose the right {product_category} for room size?"},
-                {"zh": f"{product_category}保固多久？", "en": f"What is the warranty period of the {product_category}?"},
-                {"zh": f"{product_category}遇到異常聲音怎麼辦？", "en": f"What to do if the {product_category} makes abnormal noise?"},
-                {"zh": f"{product_category}是否有自動斷電功能？", "en": f"Does the {product_category} have an auto power-off function?"}
-            ]
+            try:
+                # 同一品牌/市場/品類的 FAQ 很少變動，提示詞相同時直接沿用快取的回應
+                faqs = self._call_gemini_json(prompt, FAQ_CACHE_EXPIRATION_SECONDS, _valid_faqs)[:10]
+                if faqs:
+                    return faqs
+            except Exception:
+                pass
+        # 未設定 Gemini、呼叫或解析失敗，或回應中沒有可用的 FAQ 時，回傳備用範例
+        return [
+            {"zh": f"{product_category}的耗電量是多少？", "en": f"What is the power consumption of the {product_category}?"},
+            {"zh": f"如何選擇適合房間大小的{product_category}？", "en": f"How to choose the right {product_category} for room size?"},
+            {"zh": f"{product_category}保固多久？", "en": f"What is the warranty period of the {product_category}?"},
+            {"zh": f"{product_category}遇到異常聲音怎麼辦？", "en": f"What to do if the {product_category} makes abnormal noise?"},
+            {"zh": f"{product_category}是否有自動斷電功能？", "en": f"Does the {product_category} have an auto power-off function?"}
+        ]
 
-    def _check_faq_coverage(self, faq: Dict, page_text: str) -> Tuple[bool, str, bool]:
+    def _check_faq_coverage(self, faq: Dict, page_text: str, page_location: str, page_has_authority: bool) -> Tuple[bool, str, bool]:
         """
-        檢查網站內容是否有覆蓋該FAQ，並判斷權威性。
+        檢查網站內容是否有覆蓋該FAQ；有覆蓋時沿用整頁預先判斷的出現位置與權威性
+        （權威性：有數據/專家/官方說明）。
         """
         # 關鍵字比對（中英文）
         keywords = [faq["zh"].replace("？", "").replace("?", "").strip(), faq["en"].replace("?", "").strip()]
-        found = False
-        location = ""
-        authority = False
         for kw in keywords:
             if kw and kw.lower() in page_text:
-                found = True
-                # 簡單判斷出現位置
-                if "faq" in page_text:
-                    location = "FAQ"
-                elif "產品" in page_text or "product" in page_text:
-                    location = "產品頁"
-                else:
-                    location = "首頁/其他"
-                # 權威性判斷：有數據/專家/官方說明
-                if re.search(r"(\d+|專家|醫師|官方|engineer|official|data|statistic|report|study)", page_text):
-                    authority = True
-                break
-        return found, location, authority
+                return True, page_location, page_has_authority
+        return False, "", False
     
-    def _generate_recommendations(self, root_files: Dict, architecture_signals: Dict, 
-                                llm_friendliness: Dict, product_authority: Dict, faq_analysis: Dict) -> List[Dict]:
-        """使用 Gemini API 生成改善建議"""
+    def _submit_recommendations(self, root_files: Dict, architecture_signals: Dict,
+                                llm_friendliness: Dict, product_authority: Dict, faq_analysis: Dict) -> Optional[Future]:
+        """在背景送出 Gemini 改善建議請求，讓 LLM 往返時間與評論抓取重疊；未設定 Gemini 時回傳 None"""
         if not self.gemini_model:
-            return self._generate_fallback_recommendations(
-                root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
-            )
-        
-        st.write("🤖 生成 AI 改善建議...")
-        
-        try:
-            # 準備分析數據
-            analysis_data = {
-                "root_files": root_files,
-                "architecture_signals": architecture_signals,
-                "llm_friendliness": llm_friendliness,
-                "product_authority": product_authority,
-                "faq_analysis": faq_analysis
-            }
-            
-            prompt = f"""
+            return None
+        analysis_data = {
+            "root_files": root_files,
+            "architecture_signals": architecture_signals,
+            "llm_friendliness": llm_friendliness,
+            "product_authority": product_authority,
+            "faq_analysis": faq_analysis
+        }
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._request_recommendations, analysis_data)
+        executor.shutdown(wait=False)
+        return future
+    
+    def _request_recommendations(self, analysis_data: Dict) -> List[Dict]:
+        """向 Gemini 取得改善建議（於背景執行緒執行，不輸出狀態訊息；失敗時拋出例外）"""
+        prompt = f"""
 你是一位專業的 SIE 技術顧問，專門協助企業優化網站以提升 AI 就緒度。
 
 請根據以下網站分析結果，提供具體、可執行的改善建議：
 
 分析數據：
-{json.dumps(analysis_data, indent=2, ensure_ascii=False)}
+{_json_dumps_compact(analysis_data, sort_keys=True)}
 
 請以 JSON 格式回傳改善建議，格式如下：
 {{
@@ -679,204 +1238,74 @@ class WebsiteAIReadinessAnalyzer:
 請確保建議具體、可執行，並針對 AI 就緒度優化。
 請只回傳 JSON 格式，不要包含其他文字。
 """
-            
-            response = self.gemini_model.generate_content(prompt)
-            
-            # 嘗試解析 JSON 回應
-            try:
-                # 清理回應文字，移除可能的 markdown 格式
-                response_text = response.text.strip()
-                if response_text.startswith('```json'):
-                    response_text = response_text[7:]
-                if response_text.endswith('```'):
-                    response_text = response_text[:-3]
-                response_text = response_text.strip()
-                
-                recommendations_data = json.loads(response_text)
-                return recommendations_data.get("recommendations", [])
-                
-            except json.JSONDecodeError as json_error:
-                st.warning(f"⚠️ Gemini API 回應格式錯誤: {str(json_error)}")
-                st.info("使用備用建議生成...")
-                return self._generate_fallback_recommendations(
-                    root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
-                )
-            
-        except Exception as e:
-            st.warning(f"⚠️ Gemini API 生成建議失敗: {str(e)}")
-            st.info("使用備用建議生成...")
+        
+        # 相同分析結果（例如重試、同日重複分析同一網站）的提示詞相同，直接沿用快取的回應
+        recommendations = self._call_gemini_json(prompt, RECOMMENDATION_CACHE_EXPIRATION_SECONDS, _valid_recommendations)
+        if not recommendations:
+            raise ValueError("Gemini 回應中沒有可用的改善建議")
+        return recommendations
+    
+    def _call_gemini_json(self, prompt: str, max_age_seconds: int, validate: Callable[[object], List[Dict]]) -> List[Dict]:
+        """呼叫 Gemini 並解析 JSON 回應，以 validate 取出格式正確的項目；以提示詞內容為快取鍵，
+        相同提示詞在 max_age_seconds 內直接沿用先前的回應。只快取有可用項目的回應"""
+        cache_key = "gemini|" + prompt
+        cached = _load_cached_json(cache_key, max_age_seconds)
+        if cached is not None:
+            items = validate(cached)
+            if items:
+                return items
+        # 要求模型直接輸出 JSON，回應本身即可解析，不必再清除 markdown 標記
+        response = self.gemini_model.generate_content(prompt, generation_config=JSON_GENERATION_CONFIG)
+        data = _json_loads(response.text)
+        items = validate(data)
+        if items:
+            _save_cached_json(cache_key, data)
+        return items
+    
+    def _generate_recommendations(self, root_files: Dict, architecture_signals: Dict, 
+                                llm_friendliness: Dict, product_authority: Dict, faq_analysis: Dict,
+                                recommendations_future: Optional[Future]) -> List[Dict]:
+        """取得背景產生的 Gemini 改善建議；未設定 Gemini 或失敗時使用備用建議"""
+        if recommendations_future is None:
             return self._generate_fallback_recommendations(
                 root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
             )
+        
+        self._begin_section("🤖 生成 AI 改善建議...")
+        
+        try:
+            return recommendations_future.result()
+        except json.JSONDecodeError as json_error:
+            self._report(f"⚠️ Gemini API 回應格式錯誤: {str(json_error)}")
+        except Exception as e:
+            self._report(f"⚠️ Gemini API 生成建議失敗: {str(e)}")
+        self._report("使用備用建議生成...")
+        return self._generate_fallback_recommendations(
+            root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis
+        )
     
     def _generate_fallback_recommendations(self, root_files: Dict, architecture_signals: Dict, 
                                          llm_friendliness: Dict, product_authority: Dict, faq_analysis: Dict) -> List[Dict]:
         """生成備用改善建議（當 Gemini API 不可用時）"""
-        recommendations = []
-        
-        # Root Files 建議
-        if not root_files["has_robots_txt"]:
-            recommendations.append({
-                "issue": "缺少 robots.txt 檔案",
-                "recommendation": "請在網站根目錄建立 robots.txt 檔案，這是網站與搜尋引擎和 AI 機器人溝通的重要檔案。\n\n建議內容：\n```\nUser-agent: *\nAllow: /\nUser-agent: Google-Extended\nAllow: /\nUser-agent: GPTBot\nAllow: /\nUser-agent: anthropic-ai\nAllow: /\n\nSitemap: https://yourdomain.com/sitemap.xml\n```\n\n這將確保所有搜尋引擎和 AI 機器人都能正確存取您的網站內容。",
-                "priority": "High",
-                "category": "Root Files"
-            })
-        
-        if not root_files["robots_allows_ai_bots"]:
-            recommendations.append({
-                "issue": "robots.txt 封鎖 AI 機器人",
-                "recommendation": "請修改 robots.txt，確保允許 Google-Extended 與 GPTBot 等 AI User-Agent 進行存取。建議添加：User-agent: Google-Extended 和 Allow: /。",
-                "priority": "High",
-                "category": "Root Files"
-            })
-        
-        if not root_files["has_sitemap_xml"]:
-            recommendations.append({
-                "issue": "缺少 sitemap.xml 檔案",
-                "recommendation": "請建立 sitemap.xml 檔案，這是幫助搜尋引擎和 AI 理解網站結構的重要檔案。\n\n建議內容結構：\n```xml\n<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n  <url>\n    <loc>https://yourdomain.com/</loc>\n    <lastmod>2024-01-01</lastmod>\n    <changefreq>weekly</changefreq>\n    <priority>1.0</priority>\n  </url>\n  <url>\n    <loc>https://yourdomain.com/products</loc>\n    <lastmod>2024-01-01</lastmod>\n    <changefreq>weekly</changefreq>\n    <priority>0.8</priority>\n  </url>\n</urlset>\n```\n\n包含所有重要頁面，並定期更新以反映最新內容。",
-                "priority": "Medium",
-                "category": "Root Files"
-            })
-        
-        if not root_files["sitemap_is_valid"]:
-            recommendations.append({
-                "issue": "sitemap.xml 格式錯誤",
-                "recommendation": "請檢查 sitemap.xml 檔案格式，確保符合 XML 標準，包含正確的 URL 結構。",
-                "priority": "Medium",
-                "category": "Root Files"
-            })
-        
-        # Architecture 建議
-        if not architecture_signals["uses_https"]:
-            recommendations.append({
-                "issue": "未使用 HTTPS 加密",
-                "recommendation": "請啟用 HTTPS 加密連線，這對網站安全性和搜尋引擎排名都很重要。可以透過 SSL 憑證提供商或 CDN 服務實現。",
-                "priority": "High",
-                "category": "Architecture"
-            })
-        
-        if architecture_signals["internal_link_structure"] == "poor":
-            recommendations.append({
-                "issue": "內部連結結構較差",
-                "recommendation": "請改善網站內部連結結構，確保主要頁面都有清晰的導航連結，這有助於 AI 理解網站內容關聯性。",
-                "priority": "Medium",
-                "category": "Architecture"
-            })
-        
-        # LLM Friendliness 建議
-        if not llm_friendliness["schema_detected"]:
-            recommendations.append({
-                "issue": "缺少結構化資料",
-                "recommendation": "請為網站添加 Schema.org 結構化資料，這對 AI 理解內容語義至關重要。建議實施以下標記：\n\n1. **組織標記 (Organization)**：包含公司名稱、logo、聯絡資訊\n2. **產品標記 (Product)**：包含產品名稱、描述、價格、規格\n3. **文章標記 (Article)**：包含標題、作者、發布日期\n4. **FAQ 標記 (FAQPage)**：包含問題和答案\n5. **麵包屑標記 (BreadcrumbList)**：顯示頁面層級結構\n\n實施方式：在 HTML 的 <head> 區塊中添加 <script type=\"application/ld+json\"> 標籤，包含結構化資料 JSON。這將大幅提升 AI 對網站內容的理解能力。",
-                "priority": "Medium",
-                "category": "LLM Friendliness"
-            })
-        
-        if llm_friendliness["content_readability"] == "poor":
-            recommendations.append({
-                "issue": "內容結構較差",
-                "recommendation": "請改善內容結構，使用清晰的標題層級（H1, H2, H3）組織內容，確保內容邏輯清晰，便於 AI 理解。",
-                "priority": "Medium",
-                "category": "LLM Friendliness"
-            })
-        
-        if not llm_friendliness["semantic_html"]:
-            recommendations.append({
-                "issue": "未使用語義化 HTML",
-                "recommendation": "請使用語義化 HTML 標籤，這對 AI 理解內容結構至關重要。\n\n建議使用的標籤：\n- **<header>**：頁面或區塊的標題區域\n- **<nav>**：導航選單\n- **<main>**：主要內容區域\n- **<article>**：獨立的文章或產品內容\n- **<section>**：內容區塊\n- **<aside>**：側邊欄或相關內容\n- **<footer>**：頁面底部\n\n範例結構：\n```html\n<header>\n  <nav>導航選單</nav>\n</header>\n<main>\n  <article>\n    <section>產品介紹</section>\n    <section>技術規格</section>\n  </article>\n  <aside>相關產品</aside>\n</main>\n<footer>聯絡資訊</footer>\n```\n\n這將大幅提升 AI 對網站結構的理解能力。",
-                "priority": "Medium",
-                "category": "LLM Friendliness"
-            })
-        
-        if llm_friendliness["content_hierarchy"] == "poor":
-            recommendations.append({
-                "issue": "內容層級結構較差",
-                "recommendation": "請改善內容層級結構，確保每個頁面有且僅有一個 H1 標題，並使用 H2、H3 等建立清晰的內容層級。",
-                "priority": "Medium",
-                "category": "LLM Friendliness"
-            })
-        
-        # Product Authority 建議
-        if product_authority["product_info_completeness"] in ["poor", "fair"]:
-            recommendations.append({
-                "issue": "產品資訊不完整",
-                "recommendation": "請完善產品資訊，包含詳細的技術規格、產品比較功能、專家評測、使用指南等內容，提升產品權威性。",
-                "priority": "Medium",
-                "category": "Product Authority"
-            })
-        
-        if product_authority["product_pages_found"] == 0:
-            recommendations.append({
-                "issue": "未發現產品相關頁面",
-                "recommendation": "請建立專門的產品頁面，包含產品介紹、規格、功能說明等內容，幫助消費者了解產品特性。",
-                "priority": "High",
-                "category": "Product Authority"
-            })
-        
-        if not product_authority["technical_specs_available"]:
-            recommendations.append({
-                "issue": "缺少技術規格資訊",
-                "recommendation": "請為產品提供詳細的技術規格和參數，包括尺寸、重量、功率、功能特點等，提升產品資訊的專業性。",
-                "priority": "Medium",
-                "category": "Product Authority"
-            })
-        
-        # FAQ 建議
-        if not faq_analysis["faq_section_found"]:
-            recommendations.append({
-                "issue": "缺少 FAQ 區塊",
-                "recommendation": "請建立 FAQ 區塊，回答消費者常見問題，這不僅能提升用戶體驗，也能增加網站內容的權威性。",
-                "priority": "Medium",
-                "category": "FAQ"
-            })
-        
-        if faq_analysis["qa_content_quality"] in ["poor", "fair"]:
-            recommendations.append({
-                "issue": "FAQ 內容品質較差",
-                "recommendation": "請改善 FAQ 內容品質，包含產品特定問題、使用問題、常見問題等，確保回答詳細且實用。",
-                "priority": "Medium",
-                "category": "FAQ"
-            })
-        
-        if not faq_analysis["product_specific_qa"]:
-            recommendations.append({
-                "issue": "缺少產品特定問題解答",
-                "recommendation": "請在 FAQ 中包含產品特定的問題和解答，幫助消費者更好地了解產品使用方法和注意事項。",
-                "priority": "Medium",
-                "category": "FAQ"
-            })
+        recommendations = [
+            template._asdict() for rule, template in FALLBACK_RULES
+            if rule(root_files, architecture_signals, llm_friendliness, product_authority, faq_analysis)
+        ]
         
         # 如果沒有發現任何問題，提供一般性建議
         if not recommendations:
-            recommendations.append({
-                "issue": "網站基礎良好",
-                "recommendation": "您的網站基礎架構良好！建議持續監控 AI 就緒度指標，並考慮建立 llms.txt 檔案以適應未來 AI 搜尋需求。",
-                "priority": "Low",
-                "category": "General"
-            })
+            recommendations.append(FALLBACK_GENERAL_RECOMMENDATION._asdict())
         
         return recommendations
     
     def _generate_seo_llm_recommendations(self, website_url: str, root_files: Dict, architecture_signals: Dict,
                                         llm_friendliness: Dict, product_authority: Dict, faq_analysis: Dict) -> List[Dict]:
         """生成 SEO 與 LLM 友善度改善建議"""
-        st.write("🎯 生成 SEO 與 LLM 友善度建議...")
-        
-        seo_llm_recommendations = []
+        self._begin_section("🎯 生成 SEO 與 LLM 友善度建議...")
         
-        # SEO 基礎建議
-        seo_llm_recommendations.append({
-            "category": "SEO 基礎優化",
-            "recommendations": [
-                "建立完整的 XML Sitemap，包含所有重要頁面",
-                "優化 robots.txt，確保搜尋引擎和 AI 機器人正確存取",
-                "實施 HTTPS 加密，提升安全性和信任度",
-                "改善網站載入速度，優化 Core Web Vitals 指標"
-            ]
-        })
+        # 固定內容直接取用模組層級範本，只有內容結構建議依分析結果組成
+        seo_llm_recommendations = [dict(SEO_BASE_RECOMMENDATIONS)]
         
-        # 內容結構建議
         content_recommendations = []
         if llm_friendliness["content_readability"] != "good":
             content_recommendations.append("使用清晰的標題層級結構（H1 > H2 > H3）")
@@ -884,59 +1313,23 @@ class WebsiteAIReadinessAnalyzer:
             content_recommendations.append("實施語義化 HTML 標籤")
         if not llm_friendliness["schema_detected"]:
             content_recommendations.append("添加 Schema.org 結構化資料")
-        
         if content_recommendations:
             seo_llm_recommendations.append({
                 "category": "內容結構優化",
                 "recommendations": content_recommendations
             })
         
-        # LLM 友善度建議
-        llm_recommendations = [
-            "建立 llms.txt 檔案，明確告知 AI 模型如何處理網站內容",
-            "使用自然語言撰寫內容，避免過度優化關鍵字",
-            "提供完整的產品資訊和技術規格",
-            "建立 FAQ 區塊，回答消費者常見問題",
-            "使用內部連結建立內容關聯性",
-            "確保內容的可讀性和可理解性"
-        ]
-        
-        seo_llm_recommendations.append({
-            "category": "LLM 友善度優化",
-            "recommendations": llm_recommendations
-        })
-        
-        # 產品權威性建議
-        if product_authority["product_info_completeness"] in ["poor", "fair"]:
-            seo_llm_recommendations.append({
-                "category": "產品權威性建立",
-                "recommendations": [
-                    "提供詳細的產品技術規格和參數",
-                    "建立產品比較功能，幫助消費者選擇",
-                    "發布專家評測和使用指南",
-                    "建立產品使用教學和維護指南",
-                    "提供產品相關的專業知識內容"
-                ]
-            })
-        
-        # 未來 LLM 收錄建議
-        seo_llm_recommendations.append({
-            "category": "未來 LLM 收錄準備",
-            "recommendations": [
-                "建立完整的產品知識庫",
-                "提供結構化的產品資訊",
-                "使用標準化的內容格式",
-                "建立內容更新機制",
-                "監控 AI 模型對內容的存取和使用情況",
-                "準備適應未來 AI 搜尋演算法的內容策略"
-            ]
-        })
+        seo_llm_recommendations.append(dict(LLM_BASE_RECOMMENDATIONS))
+        if product_authority["product_info_completeness"] in _POOR_OR_FAIR:
+            seo_llm_recommendations.append(dict(AUTHORITY_BASE_RECOMMENDATIONS))
+        seo_llm_recommendations.append(dict(FUTURE_BASE_RECOMMENDATIONS))
         
         return seo_llm_recommendations
 
-    def _check_user_reviews(self, website_url: str) -> Dict:
+    def _check_user_reviews(self, website_url: str, homepage_soup: BeautifulSoup) -> Dict:
         """
         偵測網站是否有用戶評論（支援中英文，含 schema.org、常見 class/id、關鍵字 fallback、分頁抓取、情感分析）
+        第一頁沿用已解析的首頁，後續分頁透過 self.session 抓取以重用連線。
         """
         result = {
             "has_review_schema": False,
@@ -952,129 +1345,119 @@ class WebsiteAIReadinessAnalyzer:
         try:
             all_reviews = []
             visited_urls = set()
-            def fetch_reviews(url, page_num=1):
-                if url in visited_urls or page_num > max_pages or len(all_reviews) >= max_reviews:
-                    return
-                visited_urls.add(url)
-                response = requests.get(url, timeout=10)
-                if response.status_code != 200:
-                    return
-                soup = BeautifulSoup(response.content, 'html.parser')
-                page_text = soup.get_text(separator='\n').lower()
+            def fetch_page(url):
+                """抓取並解析單一頁面（於工作執行緒執行），失敗時回傳 None。
+                連線、解碼（urllib3）與解析錯誤都只略過該頁，不影響其他頁面已取得的評論"""
+                if url == website_url:
+                    return homepage_soup
+                try:
+                    status_code, content = self._fetch_capped(url, HOMEPAGE_MAX_BYTES)
+                    if status_code != 200:
+                        return None
+                    return _parse_html(content, _REVIEW_PAGE_STRAINER)
+                except Exception:
+                    return None
+            def ingest_schema(item, page_num):
+                """處理單一 JSON-LD 物件中的 Review/AggregateRating，有評論資料時回傳 True"""
+                review = item.get('review')
+                aggregate = item.get('aggregateRating')
+                types = _ld_types(item)
+                for nested in (review, aggregate):
+                    if isinstance(nested, dict):
+                        types += _ld_types(nested)
+                if not _LD_REVIEW_TYPES.intersection(types):
+                    return False
+                result["has_review_schema"] = True
+                if isinstance(aggregate, dict):
+                    result["average_rating"] = aggregate.get('ratingValue')
+                    result["review_count"] = aggregate.get('reviewCount', aggregate.get('ratingCount', 0))
+                if review:
+                    reviews = [review] if isinstance(review, dict) else review
+                    for r in reviews:
+                        if len(all_reviews) >= max_reviews:
+                            break
+                        if not isinstance(r, dict):
+                            continue
+                        all_reviews.append({
+                            "author": r.get('author', {}).get('name') if isinstance(r.get('author'), dict) else r.get('author'),
+                            "rating": r.get('reviewRating', {}).get('ratingValue') if isinstance(r.get('reviewRating'), dict) else None,
+                            "text": r.get('reviewBody', r.get('description', '')),
+                            "page": page_num
+                        })
+                return True
+            def process_page(url, page_num, soup):
+                """擷取單一頁面的評論資訊，回傳偵測到的下一頁網址"""
+                next_urls = []
                 # 1. schema.org Review/AggregateRating
                 schema_scripts = soup.find_all('script', type='application/ld+json')
                 for script in schema_scripts:
+                    raw = script.get_text()
+                    # 先以字串檢查略過 Organization、BreadcrumbList 等與評論無關的區塊，不必解析
+                    if not _LD_REVIEW_NEEDLE_RE.search(raw):
+                        continue
                     try:
-                        if script.string is None:
-                            continue
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            types = [data.get('@type', '')]
-                            if 'review' in data or 'aggregateRating' in data:
-                                types += [data.get('review', {}).get('@type', ''), data.get('aggregateRating', {}).get('@type', '')]
-                            for t in types:
-                                if t and t.lower() in ['review', 'aggregaterating']:
-                                    result["has_review_schema"] = True
-                                    if 'aggregateRating' in data:
-                                        agg = data['aggregateRating']
-                                        result["average_rating"] = agg.get('ratingValue')
-                                        result["review_count"] = agg.get('reviewCount', agg.get('ratingCount', 0))
-                                    if 'review' in data:
-                                        reviews = data['review']
-                                        if isinstance(reviews, dict):
-                                            reviews = [reviews]
-                                        for r in reviews:
-                                            if len(all_reviews) >= max_reviews:
-                                                break
-                                            all_reviews.append({
-                                                "author": r.get('author', {}).get('name') if isinstance(r.get('author'), dict) else r.get('author'),
-                                                "rating": r.get('reviewRating', {}).get('ratingValue') if isinstance(r.get('reviewRating'), dict) else None,
-                                                "text": r.get('reviewBody', r.get('description', '')),
-                                                "page": page_num
-                                            })
-                                    break
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict) and item.get('@type', '').lower() in ['review', 'aggregaterating']:
-                                    result["has_review_schema"] = True
-                                    if 'aggregateRating' in item:
-                                        agg = item['aggregateRating']
-                                        result["average_rating"] = agg.get('ratingValue')
-                                        result["review_count"] = agg.get('reviewCount', agg.get('ratingCount', 0))
-                                    if 'review' in item:
-                                        reviews = item['review']
-                                        if isinstance(reviews, dict):
-                                            reviews = [reviews]
-                                        for r in reviews:
-                                            if len(all_reviews) >= max_reviews:
-                                                break
-                                            all_reviews.append({
-                                                "author": r.get('author', {}).get('name') if isinstance(r.get('author'), dict) else r.get('author'),
-                                                "rating": r.get('reviewRating', {}).get('ratingValue') if isinstance(r.get('reviewRating'), dict) else None,
-                                                "text": r.get('reviewBody', r.get('description', '')),
-                                                "page": page_num
-                                            })
-                                    break
+                        for item in _iter_ld_items(_json_loads(raw)):
+                            if ingest_schema(item, page_num):
+                                break
                     except Exception:
                         continue
+                # 結構化資料已取得足夠評論時，HTML 區塊與關鍵字等後備偵測及分頁都不必再做
+                if len(all_reviews) >= max_reviews:
+                    return next_urls
                 # 2. HTML 區塊偵測（常見 class/id，多語系）
-                review_classes = [
-                    'review', 'reviews', 'user-review', 'user-reviews', 'comment', 'comments', 'rating', 'ratings',
-                    '評價', '用戶評論', '用戶評價', '買家評論', '買家評價', '商品評論', '商品評價', '星級', '星星', '星', '評論'
-                ]
-                found_blocks = []
-                for cls in review_classes:
-                    found_blocks += soup.find_all(class_=re.compile(cls, re.I))
-                    found_blocks += soup.find_all(id=re.compile(cls, re.I))
+                found_blocks = soup.find_all(_is_review_block)
                 if found_blocks:
                     result["review_block_found"] = True
                     for block in found_blocks:
                         if len(all_reviews) >= max_reviews:
                             break
-                        text = block.get_text(separator=' ', strip=True)
+                        text = _snippet(block)
                         if text:
-                            all_reviews.append({"author": None, "rating": None, "text": text[:200], "page": page_num})
-                # 3. 關鍵字 fallback（多語系）
-                review_keywords = [
-                    'review', 'reviews', 'user review', 'user reviews', 'comment', 'comments', 'rating', 'ratings',
-                    '評價', '用戶評論', '用戶評價', '買家評論', '買家評價', '商品評論', '商品評價', '星級', '星星', '星', '評論'
-                ]
-                if any(kw in page_text for kw in review_keywords):
+                            all_reviews.append({"author": None, "rating": None, "text": text, "page": page_num})
+                # 3. 關鍵字 fallback（多語系）：逐一掃描文字節點（不分大小寫），找到第一個即停止，
+                #    不必先串接並轉小寫整頁文字
+                #    先前頁面已找到關鍵字時不必再掃描
+                if not result["review_keywords_found"] and any(_REVIEW_KEYWORD_RE.search(text) for text in soup.strings):
                     result["review_keywords_found"] = True
                 # 4. 分頁偵測
                 if len(all_reviews) < max_reviews:
-                    next_page_selectors = [
-                        {'tag': 'a', 'text': ['next', '下一頁', '下頁', 'more reviews', '更多評論', '查看更多', '>>', '›']},
-                        {'tag': 'button', 'text': ['next', '下一頁', '下頁', 'more reviews', '更多評論', '查看更多', '>>', '›']}
-                    ]
-                    for sel in next_page_selectors:
-                        for el in soup.find_all(sel['tag']):
-                            el_text = el.get_text().strip().lower()
-                            if any(t in el_text for t in sel['text']):
-                                href = el.get('href')
-                                if href and not href.startswith('#'):
-                                    next_url = urljoin(url, href)
-                                    if next_url not in visited_urls:
-                                        fetch_reviews(next_url, page_num+1)
-                                # button 可能是 JS 載入，這裡僅支援靜態 href
-            fetch_reviews(website_url)
-            # 情感分析（簡易詞典法，可換 LLM）
-            def simple_sentiment(text):
-                pos_words = ['good', 'great', 'excellent', 'love', 'best', '讚', '好', '棒', '推薦', '滿意', '值得', '喜歡', '優秀', 'positive']
-                neg_words = ['bad', 'poor', 'terrible', 'hate', 'worst', '爛', '差', '失望', '負評', '不推', '糟', 'negative']
-                text_l = text.lower()
-                pos = any(w in text_l for w in pos_words)
-                neg = any(w in text_l for w in neg_words)
-                if pos and not neg:
-                    return 'positive'
-                elif neg and not pos:
-                    return 'negative'
-                else:
-                    return 'neutral'
-            for r in all_reviews:
-                sentiment = simple_sentiment(r['text'])
+                    for el in soup.find_all(('a', 'button')):
+                        if _NEXT_PAGE_TEXT_RE.search(el.get_text()):
+                            # button 可能是 JS 載入，這裡僅支援靜態 href
+                            href = el.get('href')
+                            if href and not href.startswith('#'):
+                                next_urls.append(urljoin(url, href))
+                return next_urls
+            # 逐層（頁數）廣度優先抓取：同一層發現的下一頁網址同時送出請求，
+            # 解析後的評論擷取與結果累計仍在主執行緒依序進行。
+            # 「查看更多」、「›」等連結在首頁上可能有數十個，每層最多只抓 MAX_REVIEW_FETCH_WORKERS 頁；
+            # 評論數達到上限後即取消尚未開始的抓取，不再送出下一層
+            level_urls = [website_url]
+            page_num = 1
+            with ThreadPoolExecutor(max_workers=MAX_REVIEW_FETCH_WORKERS) as executor:
+                while level_urls and page_num <= max_pages and len(all_reviews) < max_reviews:
+                    visited_urls.update(level_urls)
+                    next_level_urls = []
+                    futures = [executor.submit(fetch_page, url) for url in level_urls]
+                    for url, future in zip(level_urls, futures):
+                        if len(all_reviews) >= max_reviews:
+                            future.cancel()
+                            continue
+                        soup = future.result()
+                        if soup is None:
+                            continue
+                        for next_url in process_page(url, page_num, soup):
+                            if len(next_level_urls) >= MAX_REVIEW_FETCH_WORKERS:
+                                break
+                            if next_url not in visited_urls and next_url not in next_level_urls:
+                                next_level_urls.append(next_url)
+                    level_urls = next_level_urls
+                    page_num += 1
+            # 情感分析（簡易詞典法，可換 LLM）：所有頁面抓完後一次批次標記
+            sentiments = _batch_sentiment([r['text'] for r in all_reviews])
+            for r, sentiment in zip(all_reviews, sentiments):
                 r['sentiment'] = sentiment
-                result['sentiment_summary'][sentiment] += 1
+            result['sentiment_summary'].update(Counter(sentiments))
             # 補齊欄位
             result['review_samples'] = all_reviews[:10]
             result['review_count'] = len(all_reviews)
@@ -1082,7 +1465,52 @@ class WebsiteAIReadinessAnalyzer:
             pass
         return result
 
+# 完整分析結果的快取時間與筆數上限
+ANALYSIS_CACHE_TTL_SECONDS = 3600
+ANALYSIS_CACHE_MAX_ENTRIES = 256
+
+# 完整分析結果的快取（跨 session 共用）：(網址, 品類, API 金鑰雜湊) -> (分析時間, 狀態訊息, 結果)。
+# 不使用 st.cache_data：狀態框由呼叫端繪製，快取命中時以保存的狀態訊息重現，並標示完成
+_analysis_cache: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, List[str], Dict]] = {}
+_analysis_cache_lock = threading.Lock()
+
+def _get_cached_analysis(key: Tuple[str, Optional[str], Optional[str]]) -> Optional[Tuple[List[str], Dict]]:
+    """取出未過期的分析結果（深複製，呼叫端修改不影響快取）；不存在或已過期時回傳 None"""
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+    if cached is None or time.monotonic() - cached[0] >= ANALYSIS_CACHE_TTL_SECONDS:
+        return None
+    return cached[1], copy.deepcopy(cached[2])
+
+def _store_analysis(key: Tuple[str, Optional[str], Optional[str]], status_lines: List[str], result: Dict) -> None:
+    """保存成功的分析結果，超過筆數上限時淘汰最舊的一筆"""
+    with _analysis_cache_lock:
+        _analysis_cache.pop(key, None)
+        _analysis_cache[key] = (time.monotonic(), list(status_lines), copy.deepcopy(result))
+        while len(_analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+            _analysis_cache.pop(next(iter(_analysis_cache)))
+
 def run_website_analysis(website_url: str, product_category: Optional[str] = None, gemini_api_key: Optional[str] = None) -> Dict:
-    """執行網站 AI 就緒度分析的主函式"""
-    analyzer = WebsiteAIReadinessAnalyzer(gemini_api_key)
-    return analyzer.analyze_website(website_url, product_category) 
\ No newline at end of file
+    """執行網站 AI 就緒度分析的主函式；以 API 金鑰的雜湊值區分快取，金鑰本身不保存"""
+    key_hash = hashlib.sha256(gemini_api_key.encode()).hexdigest() if gemini_api_key else None
+    cache_key = (website_url, product_category, key_hash)
+    # 只在 Streamlit 執行環境中繪製狀態框；以一般 Python 呼叫（腳本、測試）時只回傳結果
+    status_box = st.status(f"🔍 正在分析網站: {website_url}", expanded=True) if st_runtime.exists() else None
+    
+    cached = _get_cached_analysis(cache_key)
+    if cached is not None:
+        status_lines, result = cached
+        if status_box is not None:
+            for line in status_lines:
+                status_box.markdown(line)
+    else:
+        # 各項檢查的訊息在完成時即寫入狀態框
+        analyzer = WebsiteAIReadinessAnalyzer(gemini_api_key, status_box.markdown if status_box is not None else None)
+        result = analyzer.analyze_website(website_url, product_category)
+        # 分析失敗的結果不快取，下次重新分析
+        if "error" not in result:
+            _store_analysis(cache_key, analyzer.status_lines, result)
+    
+    if status_box is not None:
+        status_box.update(state="error" if "error" in result else "complete")
+    return result
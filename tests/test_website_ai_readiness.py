@@ -0,0 +1,285 @@
+"""網站 AI 就緒度分析的測試：個別檢查的單元測試，以及沒有 Streamlit 執行環境時對本機 HTTP 伺服器的端對端測試"""
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from sie_module02 import website_ai_readiness
+from sie_module02.website_ai_readiness import (
+    HOMEPAGE_MAX_BYTES,
+    WebsiteAIReadinessAnalyzer,
+    _HOMEPAGE_STRAINER,
+    _batch_sentiment,
+    _normalize_url,
+    _parse_html,
+    _sitemap_root_is_valid,
+    run_website_analysis,
+)
+
+HOMEPAGE = """<!DOCTYPE html>
+<html>
+<head>
+<title>測試網站</title>
+<script type="application/ld+json">{"@context": "https://schema.org", "@type": "Organization", "name": "Test"}</script>
+</head>
+<body>
+<header><nav><a href="/products">產品</a><a href="/about">關於我們</a></nav></header>
+<main>
+<h1>測試網站</h1>
+<section><h2>常見問題 FAQ</h2><p>如何選擇產品？請參考規格。</p></section>
+</main>
+<footer>聯絡資訊</footer>
+</body>
+</html>
+""".encode("utf-8")
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc>http://localhost/</loc></url></urlset>
+"""
+
+# 路徑 -> (Content-Type, 內容)；其餘路徑（例如 llms.txt）回應 404
+PAGES = {
+    "/": ("text/html; charset=utf-8", HOMEPAGE),
+    "/robots.txt": ("text/plain", b"User-agent: *\nAllow: /\n"),
+    "/sitemap.xml": ("application/xml", SITEMAP),
+    "/counted": ("text/html; charset=utf-8", b"<html><body><p>counted</p></body></html>"),
+}
+ETAG = '"v1"'
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.server.hits[path] += 1
+        if path == "/empty.txt":
+            # 空檔案無法滿足 Range 請求
+            if "Range" in self.headers:
+                self._send(416)
+            else:
+                self._send(200)
+            return
+        if path == "/etag.txt":
+            if self.headers.get("If-None-Match") == ETAG:
+                self._send(304)
+            else:
+                self._send(200, b"hello", "text/plain", {"ETag": ETAG})
+            return
+        page = PAGES.get(path)
+        if page is None:
+            self.send_error(404)
+            return
+        content_type, body = page
+        self._send(200, body, content_type)
+
+    def _send(self, status, body=b"", content_type="text/plain", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_caches():
+    """各分析器實例共用的快取以網址為鍵，本機伺服器的連接埠可能被重複使用，每個測試前清空"""
+    WebsiteAIReadinessAnalyzer._page_cache.clear()
+    WebsiteAIReadinessAnalyzer._root_files_cache.clear()
+    website_ai_readiness._analysis_cache.clear()
+
+
+@pytest.fixture
+def site_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SiteHandler)
+    server.hits = Counter()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def site_url(site_server):
+    return f"http://127.0.0.1:{site_server.server_port}/"
+
+
+def _root_file_futures(robots=None, sitemap=None, llms=None):
+    """建立已完成的根檔案抓取結果；內容為 None 的檔案視為 404"""
+    futures = {}
+    for name, body in (("robots.txt", robots), ("sitemap.xml", sitemap), ("llms.txt", llms)):
+        future = Future()
+        future.set_result((200, body, {}) if body is not None else (404, b"", {}))
+        futures[name] = future
+    return futures
+
+
+def _check_robots(robots):
+    return WebsiteAIReadinessAnalyzer()._check_root_files("https://example.com/", _root_file_futures(robots=robots), False)
+
+
+def test_robots_agent_specific_section_blocks_ai_bot():
+    root_files = _check_robots(b"User-agent: GPTBot\nDisallow: /\n\nUser-agent: *\nAllow: /\n")
+
+    assert root_files["has_robots_txt"]
+    assert not root_files["robots_allows_ai_bots"]
+
+
+def test_robots_partial_disallow_is_not_a_block():
+    root_files = _check_robots(b"User-agent: *\nDisallow: /private\n")
+
+    assert root_files["robots_allows_ai_bots"]
+
+
+def test_empty_robots_allows_ai_bots():
+    root_files = _check_robots(b"")
+
+    assert root_files["has_robots_txt"]
+    assert root_files["robots_allows_ai_bots"]
+
+
+@pytest.mark.parametrize("content, valid", [
+    (SITEMAP, True),
+    (b'<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"/>', True),
+    (b"<!DOCTYPE html><html><head><title>Not found</title></head><body></body></html>", False),
+    (b"", False),
+])
+def test_sitemap_root_validation(content, valid):
+    assert _sitemap_root_is_valid(content) is valid
+
+
+def test_link_classification_by_host():
+    html = b"""<html><body>
+    <a href="/about">about</a><a href="page.html">page</a><a href="?page=2">next</a>
+    <a href="https://example.com/products">products</a>
+    <a href="https://other.example.org/">other</a><a href="mailto:info@example.com">mail</a>
+    <a href="https://evil.test/?u=https://example.com/">substring</a>
+    </body></html>"""
+    analyzer = WebsiteAIReadinessAnalyzer()
+    signals = analyzer._check_architecture_signals("https://example.com/", _parse_html(html, _HOMEPAGE_STRAINER))
+
+    assert signals["uses_https"]
+    assert signals["internal_link_structure"] == "fair"  # 4 個站內連結
+    assert signals["external_links_count"] == 3
+
+
+def test_json_ld_graph_and_list_types():
+    html = b"""<html><head>
+    <script type="application/ld+json">{"@context": "https://schema.org", "@graph": [
+        {"@type": "Organization", "name": "Test"}, {"@type": ["Product", "Thing"], "name": "Widget"}]}</script>
+    <script type="application/ld+json">[{"@type": "BreadcrumbList"}]</script>
+    <script type="application/ld+json">{"@type": "FAQPage"}</script>
+    <script type="application/ld+json">{{ template_placeholder }}</script>
+    </head><body><h1>Title</h1></body></html>"""
+    llm_friendliness = WebsiteAIReadinessAnalyzer()._check_llm_friendliness(_parse_html(html, _HOMEPAGE_STRAINER))
+
+    assert llm_friendliness["schema_detected"] == ["Organization", "Product", "Thing", "BreadcrumbList", "FAQPage"]
+    # 分數沿用原本的定義：每個頂層為物件的 JSON-LD 區塊一分
+    assert llm_friendliness["structured_data_score"] == 2
+
+
+def test_batch_sentiment_mixed_languages():
+    texts = [
+        "Great product, love it",
+        "質感很好，推薦給大家",
+        "Terrible, the worst purchase",
+        "很失望",
+        "Goodness, it arrived on Tuesday",
+        "Good price but 品質很差",
+        "",
+        "İstanbul delivery was bad",
+    ]
+
+    assert _batch_sentiment(texts) == [
+        "positive", "positive", "negative", "negative", "neutral", "neutral", "neutral", "negative",
+    ]
+
+
+def test_root_file_416_is_empty_file(site_url):
+    assert WebsiteAIReadinessAnalyzer()._fetch_root_file(site_url + "empty.txt", 1024) == (200, b"", {})
+
+
+def test_root_file_304_reuses_previous_result(site_url, site_server):
+    analyzer = WebsiteAIReadinessAnalyzer()
+    first = analyzer._fetch_root_file(site_url + "etag.txt", 1024)
+    second = analyzer._fetch_root_file(site_url + "etag.txt", 1024, first)
+
+    assert first == (200, b"hello", {"ETag": ETAG})
+    assert second is first
+    assert site_server.hits["/etag.txt"] == 2
+
+
+def test_normalize_url():
+    assert _normalize_url("HTTPS://Example.COM?utm_source=x&page=2&gclid=1#frag") == "https://example.com/?page=2"
+    assert _normalize_url("https://example.com/a?b=1&utm_medium=mail") == "https://example.com/a?b=1"
+
+
+def test_page_cache_normalizes_urls_and_expires(site_url, site_server, monkeypatch):
+    analyzer = WebsiteAIReadinessAnalyzer()
+
+    assert analyzer._fetch_capped(site_url + "counted", HOMEPAGE_MAX_BYTES)[0] == 200
+    assert analyzer._fetch_capped(site_url + "counted?utm_source=mail#top", HOMEPAGE_MAX_BYTES)[0] == 200
+    assert site_server.hits["/counted"] == 1
+
+    monkeypatch.setattr(website_ai_readiness, "PAGE_CACHE_TTL_SECONDS", 0)
+    analyzer._fetch_capped(site_url + "counted", HOMEPAGE_MAX_BYTES)
+    assert site_server.hits["/counted"] == 2
+
+
+def test_page_cache_skips_errors(site_url, site_server):
+    analyzer = WebsiteAIReadinessAnalyzer()
+
+    assert analyzer._fetch_capped(site_url + "missing", HOMEPAGE_MAX_BYTES) == (404, b"")
+    assert analyzer._fetch_capped(site_url + "missing", HOMEPAGE_MAX_BYTES) == (404, b"")
+    assert site_server.hits["/missing"] == 2
+
+
+def test_analyze_website_without_streamlit_runtime(site_url):
+    analyzer = WebsiteAIReadinessAnalyzer()
+    result = analyzer.analyze_website(site_url)
+
+    assert "error" not in result
+    root_files = result["technical_seo_ai_readiness"]["root_files"]
+    assert root_files["has_robots_txt"]
+    assert root_files["robots_allows_ai_bots"]
+    assert root_files["sitemap_is_valid"]
+    assert not root_files["has_llms_txt"]
+    assert result["technical_seo_ai_readiness"]["llm_friendliness"]["schema_detected"]
+    assert "**📁 檢查根檔案...**" in analyzer.status_lines
+
+
+def test_analyze_website_reports_homepage_error(site_url):
+    analyzer = WebsiteAIReadinessAnalyzer()
+    result = analyzer.analyze_website(site_url + "missing")
+
+    assert result == {"error": "homepage HTTP 404"}
+    assert analyzer.status_lines[-1].startswith("❌")
+
+
+def test_run_website_analysis_caches_without_streamlit_runtime(site_url):
+    first = run_website_analysis(site_url)
+    second = run_website_analysis(site_url)
+
+    assert "error" not in first
+    assert second == first
+    assert second is not first
+
+
+def test_recommendation_steps_without_streamlit_runtime(site_url):
+    analyzer = WebsiteAIReadinessAnalyzer()
+    result = analyzer.analyze_website(site_url)
+
+    readiness = result["technical_seo_ai_readiness"]
+    assert readiness["actionable_recommendations"]
+    assert readiness["seo_llm_recommendations"]
+    assert "**🎯 生成 SEO 與 LLM 友善度建議...**" in analyzer.status_lines